@@ -6,21 +6,108 @@ Target: < 1s latency for updates
 
 import dash
 from dash import dcc, html, Input, Output, State
-import plotly.graph_objs as go
+from dash.exceptions import PreventUpdate
+import plotly.io as pio
 import plotly.express as px
+import zlib
 import numpy as np
-from pricing import OptionParams, OptionsPricingEngine
+from functools import lru_cache
+from pricing import (
+    OptionParams, OptionsPricingEngine, delta_batch
+)
 from hedging import Portfolio, Position, HedgingSimulator, MarketScenario
 
 
+# Serialize callback responses with orjson (handles NumPy arrays natively)
+pio.json.config.default_engine = 'orjson'
+
 # Initialize Dash app
-app = dash.Dash(__name__, suppress_callback_exceptions=True)
+app = dash.Dash(__name__, suppress_callback_exceptions=True, compress=True)  # gzip responses via flask-compress
 app.title = "Options Pricing & Hedging Simulator"
 
 # Initialize engines
 pricing_engine = OptionsPricingEngine()
 hedging_simulator = HedgingSimulator()
 
+# Last (inputs, outputs) rendered by each callback, so repeat clicks return immediately
+_last_render = {}
+
+# Figure resolution
+N_PAYOFF_POINTS = 100
+N_SURFACE = 20  # Delta surface is N_SURFACE x N_SURFACE
+
+# Hedging simulation
+N_HEDGE_SCENARIOS = 500
+N_HEDGE_BINS = 30
+
+# Figure styling (invariant across callbacks, built once at import)
+PAYOFF_LINE = dict(color='#3b82f6', width=2)
+
+PAYOFF_ZERO_LINE = dict(
+    type='line', xref='x domain', yref='y',
+    x0=0, x1=1, y0=0, y1=0,
+    line=dict(dash='dash', color='#404040')
+)
+
+PAYOFF_LAYOUT = dict(
+    plot_bgcolor='#0a0a0a',
+    paper_bgcolor='#0a0a0a',
+    font=dict(color='#a3a3a3'),
+    xaxis=dict(title='Spot Price', gridcolor='#171717'),
+    yaxis=dict(title='Profit/Loss', gridcolor='#171717'),
+    margin=dict(l=40, r=20, t=20, b=40),
+    height=300
+)
+
+SURFACE_LAYOUT = dict(
+    scene=dict(
+        xaxis=dict(title='Spot Price', backgroundcolor='#0a0a0a', gridcolor='#262626'),
+        yaxis=dict(title='Time to Maturity', backgroundcolor='#0a0a0a', gridcolor='#262626'),
+        zaxis=dict(title='Delta', backgroundcolor='#0a0a0a', gridcolor='#262626'),
+        bgcolor='#0a0a0a'
+    ),
+    paper_bgcolor='#0a0a0a',
+    font=dict(color='#a3a3a3'),
+    margin=dict(l=0, r=0, t=0, b=0),
+    height=300
+)
+
+HEDGE_LAYOUT = dict(
+    barmode='overlay',
+    plot_bgcolor='#0a0a0a',
+    paper_bgcolor='#0a0a0a',
+    font=dict(color='#a3a3a3'),
+    xaxis=dict(title='PnL', gridcolor='#171717'),
+    yaxis=dict(title='Frequency', gridcolor='#171717'),
+    legend=dict(bgcolor='#0a0a0a', bordercolor='#262626'),
+    margin=dict(l=40, r=20, t=20, b=40),
+    height=400
+)
+
+# Placeholder returned while inputs are incomplete
+_EMPTY_FIG = {'data': [], 'layout': PAYOFF_LAYOUT}
+
+
+@lru_cache(maxsize=4096)
+def _price_and_greeks_cached(spot, strike, volatility, rate, maturity, option_type, style):
+    """
+    Memoized option price and Greeks keyed on plain-float inputs
+    
+    Returns:
+        Tuple of (price, delta, gamma, vega, theta, rho)
+    """
+    params = OptionParams(spot, strike, volatility, rate, maturity, option_type, style)
+    price, greeks = pricing_engine.price_and_greeks(params)
+    return (price, greeks['delta'], greeks['gamma'], greeks['vega'], greeks['theta'], greeks['rho'])
+
+
+@lru_cache(maxsize=64)
+def _grid(start, stop, n):
+    """Cached, read-only np.linspace grid for chart axes"""
+    grid = np.linspace(start, stop, n)
+    grid.setflags(write=False)
+    return grid
+
 
 # App layout
 app.layout = html.Div([
@@ -193,18 +280,16 @@ app.layout = html.Div([
             ], style={'padding': '24px', 'backgroundColor': '#0a0a0a',
                      'borderRadius': '8px', 'border': '1px solid #262626'})
         ], style={'flex': '1'})
-    ], style={'display': 'flex', 'padding': '24px', 'backgroundColor': '#000000', 'minHeight': 'calc(100vh - 100px)'})
+    ], style={'display': 'flex', 'padding': '24px', 'backgroundColor': '#000000', 'minHeight': 'calc(100vh - 100px)'}),
+    
+    # Latest price and Greeks, formatted for display client-side
+    dcc.Store(id='greeks-store')
 ], style={'backgroundColor': '#000000', 'minHeight': '100vh', 'fontFamily': '-apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif'})
 
 
 # Callbacks
 @app.callback(
-    [Output('option-price-display', 'children'),
-     Output('delta-display', 'children'),
-     Output('gamma-display', 'children'),
-     Output('vega-display', 'children'),
-     Output('theta-display', 'children'),
-     Output('rho-display', 'children'),
+    [Output('greeks-store', 'data'),
      Output('payoff-chart', 'figure'),
      Output('greeks-chart', 'figure')],
     [Input('calculate-button', 'n_clicks')],
@@ -219,98 +304,114 @@ app.layout = html.Div([
 def update_pricing(n_clicks, spot, strike, volatility, rate, maturity, option_type, option_style):
     """Update pricing and Greeks displays"""
     if not all([spot, strike, volatility, rate, maturity]):
-        return ["$0.00"] * 6 + [go.Figure(), go.Figure()]
+        return [None, _EMPTY_FIG, _EMPTY_FIG]
     
-    # Create option parameters
-    params = OptionParams(
-        spot=spot,
-        strike=strike,
-        volatility=volatility / 100,
-        rate=rate / 100,
-        maturity=maturity,
-        option_type=option_type,
-        style=option_style
+    # Coerce to plain floats so cache keys hash consistently
+    key = (
+        float(spot), float(strike), float(volatility) / 100,
+        float(rate) / 100, float(maturity), option_type, option_style
     )
     
+    last = _last_render.get('pricing')
+    if last is not None and last[0] == key:
+        return last[1]
+    
     # Calculate price and Greeks
-    price = pricing_engine.price(params)
-    greeks = pricing_engine.greeks(params)
+    price, delta, gamma, vega, theta, rho = _price_and_greeks_cached(*key)
     
     # Create payoff diagram
-    spot_range = np.linspace(spot * 0.7, spot * 1.3, 100)
-    payoffs = []
-    
-    for s in spot_range:
-        if option_type == 'call':
-            payoff = max(s - strike, 0) - price
-        else:
-            payoff = max(strike - s, 0) - price
-        payoffs.append(payoff)
-    
-    payoff_fig = go.Figure()
-    payoff_fig.add_trace(go.Scatter(
-        x=spot_range, y=payoffs,
-        mode='lines',
-        line=dict(color='#3b82f6', width=2),
-        fill='tozeroy',
-        fillcolor='rgba(59, 130, 246, 0.1)'
-    ))
-    payoff_fig.add_hline(y=0, line_dash="dash", line_color="#404040")
-    payoff_fig.add_vline(x=strike, line_dash="dash", line_color="#f59e0b", annotation_text="Strike")
-    payoff_fig.update_layout(
-        plot_bgcolor='#0a0a0a',
-        paper_bgcolor='#0a0a0a',
-        font=dict(color='#a3a3a3'),
-        xaxis=dict(title='Spot Price', gridcolor='#171717'),
-        yaxis=dict(title='Profit/Loss', gridcolor='#171717'),
-        margin=dict(l=40, r=20, t=20, b=40),
-        height=300
-    )
+    spot_range = _grid(spot * 0.7, spot * 1.3, N_PAYOFF_POINTS)
+
+    if option_type == 'call':
+        payoffs = np.maximum(spot_range - strike, 0.0) - price
+    else:
+        payoffs = np.maximum(strike - spot_range, 0.0) - price
+
+    payoff_fig = {
+        'data': [{
+            'type': 'scatter',
+            'x': spot_range,
+            'y': payoffs,
+            'mode': 'lines',
+            'line': PAYOFF_LINE,
+            'fill': 'tozeroy',
+            'fillcolor': 'rgba(59, 130, 246, 0.1)'
+        }],
+        'layout': {
+            **PAYOFF_LAYOUT,
+            'shapes': [
+                PAYOFF_ZERO_LINE,
+                {'type': 'line', 'xref': 'x', 'yref': 'y domain',
+                 'x0': strike, 'x1': strike, 'y0': 0, 'y1': 1,
+                 'line': {'dash': 'dash', 'color': '#f59e0b'}}
+            ],
+            'annotations': [
+                {'text': 'Strike', 'xref': 'x', 'yref': 'y domain',
+                 'x': strike, 'y': 1, 'xanchor': 'left', 'yanchor': 'top',
+                 'showarrow': False}
+            ]
+        }
+    }
     
     # Create Delta surface
-    spot_range_surface = np.linspace(spot * 0.8, spot * 1.2, 30)
-    time_range = np.linspace(0.1, maturity, 30)
-    delta_surface = np.zeros((len(time_range), len(spot_range_surface)))
+    spot_range_surface = _grid(spot * 0.8, spot * 1.2, N_SURFACE)
+    time_range = _grid(0.1, maturity, N_SURFACE)
+    delta_surface = delta_batch(
+        spot_range_surface[np.newaxis, :], strike, volatility / 100, rate / 100,
+        time_range[:, np.newaxis], option_type == 'call'
+    )
+
+    greeks_fig = {
+        'data': [{
+            'type': 'surface',
+            'x': spot_range_surface,
+            'y': time_range,
+            'z': delta_surface,
+            'colorscale': 'Blues',
+            'showscale': True
+        }],
+        'layout': SURFACE_LAYOUT
+    }
     
-    for i, t in enumerate(time_range):
-        for j, s in enumerate(spot_range_surface):
-            temp_params = OptionParams(
-                spot=s, strike=strike, volatility=volatility/100,
-                rate=rate/100, maturity=t, option_type=option_type, style='european'
-            )
-            temp_greeks = pricing_engine.greeks(temp_params)
-            delta_surface[i, j] = temp_greeks['delta']
+    greeks_data = {
+        'price': float(price),
+        'delta': float(delta),
+        'gamma': float(gamma),
+        'vega': float(vega),
+        'theta': float(theta),
+        'rho': float(rho)
+    }
     
-    greeks_fig = go.Figure(data=[go.Surface(
-        x=spot_range_surface,
-        y=time_range,
-        z=delta_surface,
-        colorscale='Blues',
-        showscale=True
-    )])
-    greeks_fig.update_layout(
-        scene=dict(
-            xaxis=dict(title='Spot Price', backgroundcolor='#0a0a0a', gridcolor='#262626'),
-            yaxis=dict(title='Time to Maturity', backgroundcolor='#0a0a0a', gridcolor='#262626'),
-            zaxis=dict(title='Delta', backgroundcolor='#0a0a0a', gridcolor='#262626'),
-            bgcolor='#0a0a0a'
-        ),
-        paper_bgcolor='#0a0a0a',
-        font=dict(color='#a3a3a3'),
-        margin=dict(l=0, r=0, t=0, b=0),
-        height=300
-    )
+    outputs = (greeks_data, payoff_fig, greeks_fig)
+    _last_render['pricing'] = (key, outputs)
     
-    return (
-        f"${price:.2f}",
-        f"{greeks['delta']:.4f}",
-        f"{greeks['gamma']:.4f}",
-        f"{greeks['vega']:.4f}",
-        f"{greeks['theta']:.4f}",
-        f"{greeks['rho']:.4f}",
-        payoff_fig,
-        greeks_fig
-    )
+    return outputs
+
+
+app.clientside_callback(
+    """
+    function(data) {
+        if (!data) {
+            return ['$0.00', '$0.00', '$0.00', '$0.00', '$0.00', '$0.00'];
+        }
+        return [
+            '$' + data.price.toFixed(2),
+            data.delta.toFixed(4),
+            data.gamma.toFixed(4),
+            data.vega.toFixed(4),
+            data.theta.toFixed(4),
+            data.rho.toFixed(4)
+        ];
+    }
+    """,
+    [Output('option-price-display', 'children'),
+     Output('delta-display', 'children'),
+     Output('gamma-display', 'children'),
+     Output('vega-display', 'children'),
+     Output('theta-display', 'children'),
+     Output('rho-display', 'children')],
+    [Input('greeks-store', 'data')]
+)
 
 
 @app.callback(
@@ -326,8 +427,21 @@ def update_pricing(n_clicks, spot, strike, volatility, rate, maturity, option_ty
 )
 def run_hedging_simulation(n_clicks, spot, strike, volatility, rate, maturity, option_type):
     """Run hedging simulation and display results"""
-    if not n_clicks or not all([spot, strike, volatility, rate, maturity]):
-        return go.Figure(), ""
+    if not n_clicks:
+        raise PreventUpdate
+    if not all([spot, strike, volatility, rate, maturity]):
+        return _EMPTY_FIG, ""
+    
+    key = (
+        float(spot), float(strike), float(volatility) / 100,
+        float(rate) / 100, float(maturity), option_type
+    )
+    last = _last_render.get('hedging')
+    if last is not None and last[0] == key:
+        return last[1]
+    
+    # Seed from the inputs so identical inputs reproduce the same scenarios
+    seed = zlib.crc32(repr(key).encode())
     
     # Create portfolio
     params = OptionParams(
@@ -338,38 +452,48 @@ def run_hedging_simulation(n_clicks, spot, strike, volatility, rate, maturity, o
         Position(instrument_type='option', quantity=10, params=params)
     ])
     
-    # Run simulations
-    no_hedge = hedging_simulator.simulate_hedging_effectiveness(portfolio, 'none', n_scenarios=500)
-    delta_hedge = hedging_simulator.simulate_hedging_effectiveness(portfolio, 'delta', n_scenarios=500)
+    # Both strategies are evaluated on the same scenarios
+    scenarios = hedging_simulator.generate_scenarios(portfolio, N_HEDGE_SCENARIOS, seed=seed)
     
-    # Create histogram
-    fig = go.Figure()
-    fig.add_trace(go.Histogram(
-        x=no_hedge['pnl_values'],
-        name='No Hedge',
-        opacity=0.7,
-        marker_color='#ef4444',
-        nbinsx=30
-    ))
-    fig.add_trace(go.Histogram(
-        x=delta_hedge['pnl_values'],
-        name='Delta Hedge',
-        opacity=0.7,
-        marker_color='#10b981',
-        nbinsx=30
-    ))
+    # Run simulations one after another: the revaluation kernels are already
+    # parallel, and Numba's workqueue threading layer aborts on concurrent entry
+    simulate = hedging_simulator.simulate_hedging_effectiveness
+    no_hedge = simulate(portfolio, 'none', scenarios=scenarios, return_raw=True)
+    delta_hedge = simulate(portfolio, 'delta', scenarios=scenarios, return_raw=True)
     
-    fig.update_layout(
-        barmode='overlay',
-        plot_bgcolor='#0a0a0a',
-        paper_bgcolor='#0a0a0a',
-        font=dict(color='#a3a3a3'),
-        xaxis=dict(title='PnL', gridcolor='#171717'),
-        yaxis=dict(title='Frequency', gridcolor='#171717'),
-        legend=dict(bgcolor='#0a0a0a', bordercolor='#262626'),
-        margin=dict(l=40, r=20, t=20, b=40),
-        height=400
+    # Bin PnL server-side on shared edges so only bar heights are sent
+    edges = np.histogram_bin_edges(
+        np.concatenate([no_hedge['pnl_values'], delta_hedge['pnl_values']]),
+        bins=N_HEDGE_BINS
     )
+    centers = 0.5 * (edges[:-1] + edges[1:])
+    bin_width = edges[1] - edges[0]
+    counts_no_hedge, _ = np.histogram(no_hedge['pnl_values'], bins=edges)
+    counts_delta_hedge, _ = np.histogram(delta_hedge['pnl_values'], bins=edges)
+    
+    fig = {
+        'data': [
+            {
+                'type': 'bar',
+                'x': centers,
+                'y': counts_no_hedge,
+                'width': bin_width,
+                'name': 'No Hedge',
+                'opacity': 0.7,
+                'marker': {'color': '#ef4444'}
+            },
+            {
+                'type': 'bar',
+                'x': centers,
+                'y': counts_delta_hedge,
+                'width': bin_width,
+                'name': 'Delta Hedge',
+                'opacity': 0.7,
+                'marker': {'color': '#10b981'}
+            }
+        ],
+        'layout': HEDGE_LAYOUT
+    }
     
     # Calculate statistics
     variance_reduction = (1 - delta_hedge['pnl_var'] / no_hedge['pnl_var']) * 100
@@ -389,7 +513,10 @@ def run_hedging_simulation(n_clicks, spot, strike, volatility, rate, maturity, o
         ])
     ])
     
-    return fig, stats_text
+    outputs = (fig, stats_text)
+    _last_render['hedging'] = (key, outputs)
+    
+    return outputs
 
 
 if __name__ == '__main__':
@@ -5,9 +5,56 @@ Runs Monte Carlo simulations across 1,000+ market scenarios
 """
 
 import numpy as np
+from numba import jit, prange, types
 from typing import Dict, List, Literal, Tuple
-from dataclasses import dataclass
-from pricing import OptionParams, OptionsPricingEngine
+from dataclasses import dataclass, replace
+from pricing import (
+    OptionParams, OptionsPricingEngine, BlackScholesModel, GREEK_NAMES, black_scholes_price
+)
+
+
+# Shared generator for scenario draws (created once, reused across simulations)
+_rng = np.random.default_rng()
+
+
+@jit(types.float64[:](types.float64[:], types.float64[:], types.float64[:],
+                      types.float64[:], types.float64[:], types.float64[:],
+                      types.float64[:], types.boolean[:], types.float64, types.float64),
+     nopython=True, nogil=True, parallel=True, cache=True, fastmath=True)
+def _simulate_pnl(spots, vols, time_elapsed, strikes, rates, maturities,
+                  quantities, is_call, stock_qty, initial_value):
+    """
+    Compiled PnL of a European-only portfolio across scenarios
+    
+    Args:
+        spots: Array of scenario spot prices
+        vols: Array of scenario volatilities
+        time_elapsed: Array of scenario time steps
+        strikes: Array of option strikes (one per position)
+        rates: Array of option rates
+        maturities: Array of option maturities at inception
+        quantities: Array of option quantities
+        is_call: Boolean array, True for calls
+        stock_qty: Aggregate stock quantity
+        initial_value: Portfolio value the PnL is measured against
+        
+    Returns:
+        Array of PnL values, one per scenario
+    """
+    n_scenarios = spots.shape[0]
+    n_options = strikes.shape[0]
+    pnl = np.empty(n_scenarios)
+    
+    for i in prange(n_scenarios):
+        value = stock_qty * spots[i]
+        for j in range(n_options):
+            T = max(0.001, maturities[j] - time_elapsed[i])
+            value += quantities[j] * black_scholes_price(
+                spots[i], strikes[j], vols[i], rates[j], T, is_call[j]
+            )
+        pnl[i] = value - initial_value
+    
+    return pnl
 
 
 @dataclass
@@ -30,6 +77,22 @@ class Portfolio:
     def clear_hedges(self):
         """Remove all hedging positions (keep only original positions)"""
         self.positions = [p for p in self.positions if not hasattr(p, 'is_hedge')]
+    
+    def stock_and_options(self) -> Tuple[float, List[Position]]:
+        """
+        Net stock quantity and option legs, read from positions on every call
+        
+        Returns:
+            Tuple of (aggregate stock quantity, list of option positions)
+        """
+        stock_qty = 0.0
+        options = []
+        for position in self.positions:
+            if position.instrument_type == 'option':
+                options.append(position)
+            else:
+                stock_qty += position.quantity
+        return stock_qty, options
 
 
 class MarketScenario:
@@ -44,8 +107,10 @@ class MarketScenario:
         n_scenarios: int = 1000,
         spot_shock_range: Tuple[float, float] = (-0.2, 0.2),
         vol_shock_range: Tuple[float, float] = (-0.5, 0.5),
-        time_step: float = 1/252  # 1 day
-    ) -> List[Dict]:
+        time_step: float = 1/252,  # 1 day
+        seed: int = None,
+        rng: np.random.Generator = None
+    ) -> Dict[str, np.ndarray]:
         """
         Generate random market scenarios
         
@@ -56,29 +121,32 @@ class MarketScenario:
             spot_shock_range: Range for spot price shocks (as fraction)
             vol_shock_range: Range for volatility shocks (as fraction)
             time_step: Time step for scenarios (default: 1 trading day)
+            seed: Optional seed for reproducible scenarios (takes precedence over rng)
+            rng: Optional generator to draw from (default: shared module generator)
             
         Returns:
-            List of scenario dictionaries with spot, vol, and time changes
+            Dictionary of per-scenario arrays: spot, volatility, time_elapsed,
+            spot_shock and vol_shock
         """
-        scenarios = []
-        
-        for _ in range(n_scenarios):
-            # Random spot price shock
-            spot_shock = np.random.uniform(*spot_shock_range)
-            new_spot = base_spot * (1 + spot_shock)
-            
-            # Random volatility shock
-            vol_shock = np.random.uniform(*vol_shock_range)
-            new_vol = base_vol * (1 + vol_shock)
-            new_vol = max(0.01, new_vol)  # Ensure vol stays positive
-            
-            scenarios.append({
-                'spot': new_spot,
-                'volatility': new_vol,
-                'time_elapsed': time_step,
-                'spot_shock': spot_shock,
-                'vol_shock': vol_shock
-            })
+        if seed is not None:
+            rng = np.random.default_rng(seed)
+        elif rng is None:
+            rng = _rng
+        
+        # Draw all shocks in one batch
+        spot_shocks = rng.uniform(*spot_shock_range, size=n_scenarios)
+        vol_shocks = rng.uniform(*vol_shock_range, size=n_scenarios)
+        
+        new_spots = base_spot * (1 + spot_shocks)
+        new_vols = np.maximum(0.01, base_vol * (1 + vol_shocks))  # Ensure vol stays positive
+        
+        scenarios = {
+            'spot': new_spots,
+            'volatility': new_vols,
+            'time_elapsed': np.full(n_scenarios, time_step),
+            'spot_shock': spot_shocks,
+            'vol_shock': vol_shocks
+        }
         
         return scenarios
 
@@ -88,8 +156,15 @@ class HedgingSimulator:
     Simulates hedging strategies and measures effectiveness
     """
     
-    def __init__(self):
+    def __init__(self, rng: np.random.Generator = None):
+        """
+        Initialize hedging simulator
+        
+        Args:
+            rng: Generator for unseeded scenario draws (default: a fresh PCG64)
+        """
         self.engine = OptionsPricingEngine()
+        self.rng = rng if rng is not None else np.random.default_rng()
     
     def calculate_portfolio_value(
         self, 
@@ -121,14 +196,11 @@ class HedgingSimulator:
                 params = position.params
                 
                 # Update parameters for current market conditions
-                updated_params = OptionParams(
+                updated_params = replace(
+                    params,
                     spot=spot,
-                    strike=params.strike,
                     volatility=volatility if volatility else params.volatility,
-                    rate=params.rate,
-                    maturity=max(0.001, params.maturity - time_elapsed),
-                    option_type=params.option_type,
-                    style=params.style
+                    maturity=max(0.001, params.maturity - time_elapsed)
                 )
                 
                 option_value = self.engine.price(updated_params)
@@ -136,6 +208,80 @@ class HedgingSimulator:
         
         return total_value
     
+    @staticmethod
+    def _split_positions(portfolio: Portfolio) -> Tuple[float, List[Position], List[Position]]:
+        """Split a portfolio into its aggregate stock quantity, European and American legs"""
+        stock_qty, options = portfolio.stock_and_options()
+        european = [p for p in options if p.params.style == 'european']
+        american = [p for p in options if p.params.style != 'european']
+        
+        return stock_qty, european, american
+    
+    @staticmethod
+    def _european_leg_arrays(positions: List[Position]) -> Tuple[np.ndarray, ...]:
+        """Per-position strikes, rates, maturities, quantities and call mask"""
+        return (
+            np.array([p.params.strike for p in positions], dtype=np.float64),
+            np.array([p.params.rate for p in positions], dtype=np.float64),
+            np.array([p.params.maturity for p in positions], dtype=np.float64),
+            np.array([p.quantity for p in positions], dtype=np.float64),
+            np.array([p.params.option_type == 'call' for p in positions], dtype=np.bool_),
+        )
+    
+    def calculate_portfolio_values(
+        self,
+        portfolio: Portfolio,
+        spots: np.ndarray,
+        volatilities: np.ndarray,
+        time_elapsed: np.ndarray
+    ) -> np.ndarray:
+        """
+        Calculate total portfolio value across a batch of market states
+        
+        European options are priced as one (states x positions) Black-Scholes
+        matrix and reduced against their quantities; American options fall
+        back to the binomial tree one state at a time.
+        
+        Args:
+            portfolio: Portfolio to value
+            spots: Array of spot prices
+            volatilities: Array of volatilities (one per spot)
+            time_elapsed: Array of times elapsed since position inception
+            
+        Returns:
+            Array of total portfolio values, one per market state
+        """
+        stock_qty, european, american = self._split_positions(portfolio)
+        total_values = stock_qty * spots
+        
+        if european:
+            # Per-position invariants, broadcast against the scenario axis
+            strikes, rates, maturities, quantities, is_call = self._european_leg_arrays(european)
+            maturities = np.maximum(0.001, maturities - time_elapsed[:, np.newaxis])
+            
+            # (n_states, n_positions) price matrix, one price_vec call per option type
+            prices = np.empty(maturities.shape)
+            for option_type, columns in (('call', is_call), ('put', ~is_call)):
+                if columns.any():
+                    prices[:, columns] = BlackScholesModel.price_vec(
+                        spots[:, np.newaxis], strikes[columns], volatilities[:, np.newaxis],
+                        rates[columns], maturities[:, columns], option_type
+                    )
+            
+            total_values = total_values + prices @ quantities
+        
+        for position in american:
+            params = position.params
+            maturities = np.maximum(0.001, params.maturity - time_elapsed)
+            option_values = np.empty(len(spots), dtype=np.float64)
+            for i in range(len(spots)):
+                option_values[i] = self.engine.price(replace(
+                    params, spot=spots[i], volatility=volatilities[i], maturity=maturities[i]
+                ))
+            total_values = total_values + position.quantity * option_values
+        
+        return total_values
+    
     def calculate_portfolio_greeks(self, portfolio: Portfolio) -> Dict[str, float]:
         """
         Calculate aggregate Greeks for entire portfolio
@@ -146,19 +292,15 @@ class HedgingSimulator:
         Returns:
             Dictionary with aggregate Greek values
         """
-        total_greeks = {'delta': 0, 'gamma': 0, 'vega': 0, 'theta': 0, 'rho': 0}
+        # Stock has delta of 1, other Greeks are 0
+        stock_qty, options = portfolio.stock_and_options()
+        greeks_array = np.zeros(len(GREEK_NAMES))
+        greeks_array[0] = stock_qty
         
-        for position in portfolio.positions:
-            if position.instrument_type == 'stock':
-                # Stock has delta of 1, other Greeks are 0
-                total_greeks['delta'] += position.quantity
-            else:
-                # Calculate option Greeks
-                greeks = self.engine.greeks(position.params)
-                for greek_name, greek_value in greeks.items():
-                    total_greeks[greek_name] += position.quantity * greek_value
+        for position in options:
+            greeks_array += position.quantity * self.engine.greeks_array(position.params)
         
-        return total_greeks
+        return dict(zip(GREEK_NAMES, greeks_array.tolist()))
     
     def delta_hedge(self, portfolio: Portfolio) -> Portfolio:
         """
@@ -170,8 +312,24 @@ class HedgingSimulator:
         Returns:
             Hedged portfolio
         """
+        return self._delta_hedge_with_greeks(portfolio)[0]
+    
+    def _delta_hedge_with_greeks(
+        self, portfolio: Portfolio, greeks: Dict[str, float] = None
+    ) -> Tuple[Portfolio, Dict[str, float]]:
+        """
+        delta_hedge that also returns the hedged portfolio's Greeks
+        
+        Args:
+            portfolio: Original portfolio
+            greeks: Greeks of portfolio if already known (computed otherwise)
+            
+        Returns:
+            Tuple of (hedged portfolio, its aggregate Greeks)
+        """
         # Calculate portfolio delta
-        greeks = self.calculate_portfolio_greeks(portfolio)
+        if greeks is None:
+            greeks = self.calculate_portfolio_greeks(portfolio)
         portfolio_delta = greeks['delta']
         
         # Create hedged portfolio (copy original positions)
@@ -188,8 +346,11 @@ class HedgingSimulator:
             )
             hedge_position.is_hedge = True  # Mark as hedge position
             hedged.add_position(hedge_position)
+            
+            # Stock only carries delta, so the hedge just zeroes it
+            greeks = {**greeks, 'delta': 0.0}
         
-        return hedged
+        return hedged, greeks
     
     def gamma_hedge(self, portfolio: Portfolio, hedge_option_params: OptionParams) -> Portfolio:
         """
@@ -202,6 +363,21 @@ class HedgingSimulator:
         Returns:
             Hedged portfolio (gamma and delta neutral)
         """
+        return self._gamma_hedge_with_greeks(portfolio, hedge_option_params)[0]
+    
+    def _gamma_hedge_with_greeks(
+        self, portfolio: Portfolio, hedge_option_params: OptionParams
+    ) -> Tuple[Portfolio, Dict[str, float]]:
+        """
+        gamma_hedge that also returns the hedged portfolio's Greeks
+        
+        Args:
+            portfolio: Original portfolio
+            hedge_option_params: Parameters for the option to use as hedge
+            
+        Returns:
+            Tuple of (hedged portfolio, its aggregate Greeks)
+        """
         # Calculate portfolio Greeks
         portfolio_greeks = self.calculate_portfolio_greeks(portfolio)
         
@@ -223,18 +399,62 @@ class HedgingSimulator:
         )
         hedge_option.is_hedge = True
         hedged.add_position(hedge_option)
+        hedged_greeks = {
+            greek_name: greek_value + hedge_quantity * hedge_greeks[greek_name]
+            for greek_name, greek_value in portfolio_greeks.items()
+        }
         
         # Now delta hedge the combined portfolio
-        hedged = self.delta_hedge(hedged)
+        return self._delta_hedge_with_greeks(hedged, hedged_greeks)
+    
+    @staticmethod
+    def _base_option_params(portfolio: Portfolio) -> OptionParams:
+        """Get base parameters from the first option in the portfolio"""
+        for pos in portfolio.positions:
+            if pos.instrument_type == 'option':
+                return pos.params
+        
+        raise ValueError("Portfolio must contain at least one option")
+    
+    def generate_scenarios(
+        self,
+        portfolio: Portfolio,
+        n_scenarios: int = 1000,
+        seed: int = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Generate market scenarios around the portfolio's base option
+        
+        The result can be passed to simulate_hedging_effectiveness for several
+        strategies so they are compared on the same draws.
+        
+        Args:
+            portfolio: Portfolio whose first option sets the base spot and vol
+            n_scenarios: Number of scenarios to generate
+            seed: Optional seed for reproducible scenarios
+            
+        Returns:
+            Dictionary of per-scenario arrays (see MarketScenario.generate_scenarios)
+        """
+        base_params = self._base_option_params(portfolio)
         
-        return hedged
+        return MarketScenario.generate_scenarios(
+            base_spot=base_params.spot,
+            base_vol=base_params.volatility,
+            n_scenarios=n_scenarios,
+            seed=seed,
+            rng=self.rng
+        )
     
     def simulate_hedging_effectiveness(
         self,
         portfolio: Portfolio,
         hedge_strategy: Literal['none', 'delta', 'gamma'],
         n_scenarios: int = 1000,
-        hedge_option_params: OptionParams = None
+        hedge_option_params: OptionParams = None,
+        seed: int = None,
+        scenarios: Dict[str, np.ndarray] = None,
+        return_raw: bool = False
     ) -> Dict:
         """
         Simulate hedging effectiveness across multiple scenarios
@@ -244,29 +464,30 @@ class HedgingSimulator:
             hedge_strategy: 'none', 'delta', or 'gamma'
             n_scenarios: Number of scenarios to simulate
             hedge_option_params: Option params for gamma hedging
+            seed: Optional seed for reproducible scenarios
+            scenarios: Pre-generated scenarios to evaluate (e.g. from
+                generate_scenarios, to compare strategies on the same draws);
+                overrides n_scenarios and seed
+            return_raw: Include the per-scenario PnL array and the scenarios
+                in the results (None otherwise)
             
         Returns:
             Dictionary with simulation results and statistics
         """
-        # Get base parameters from first option in portfolio
-        base_params = None
-        for pos in portfolio.positions:
-            if pos.instrument_type == 'option':
-                base_params = pos.params
-                break
-        
-        if base_params is None:
-            raise ValueError("Portfolio must contain at least one option")
+        base_params = self._base_option_params(portfolio)
         
         # Apply hedging strategy
         if hedge_strategy == 'delta':
-            hedged_portfolio = self.delta_hedge(portfolio)
+            hedged_portfolio, hedged_greeks = self._delta_hedge_with_greeks(portfolio)
         elif hedge_strategy == 'gamma':
             if hedge_option_params is None:
                 raise ValueError("hedge_option_params required for gamma hedging")
-            hedged_portfolio = self.gamma_hedge(portfolio, hedge_option_params)
+            hedged_portfolio, hedged_greeks = self._gamma_hedge_with_greeks(
+                portfolio, hedge_option_params
+            )
         else:
             hedged_portfolio = portfolio
+            hedged_greeks = self.calculate_portfolio_greeks(portfolio)
         
         # Calculate initial values
         initial_value = self.calculate_portfolio_value(
@@ -275,49 +496,55 @@ class HedgingSimulator:
             base_params.volatility
         )
         
-        # Generate scenarios
-        scenarios = MarketScenario.generate_scenarios(
-            base_spot=base_params.spot,
-            base_vol=base_params.volatility,
-            n_scenarios=n_scenarios
-        )
+        # Generate scenarios unless shared ones were provided
+        if scenarios is None:
+            scenarios = self.generate_scenarios(portfolio, n_scenarios, seed)
+        else:
+            n_scenarios = len(scenarios['spot'])
         
-        # Simulate PnL across scenarios
-        pnl_values = []
+        # Revalue the hedged portfolio across all scenarios at once
+        stock_qty, european, american = self._split_positions(hedged_portfolio)
         
-        for scenario in scenarios:
-            new_value = self.calculate_portfolio_value(
+        if american:
+            # American legs need a binomial tree per scenario
+            pnl_array = self.calculate_portfolio_values(
                 hedged_portfolio,
-                spot=scenario['spot'],
-                volatility=scenario['volatility'],
-                time_elapsed=scenario['time_elapsed']
+                scenarios['spot'],
+                scenarios['volatility'],
+                scenarios['time_elapsed']
+            ) - initial_value
+        else:
+            pnl_array = _simulate_pnl(
+                scenarios['spot'], scenarios['volatility'], scenarios['time_elapsed'],
+                *self._european_leg_arrays(european), float(stock_qty), float(initial_value)
             )
-            
-            pnl = new_value - initial_value
-            pnl_values.append(pnl)
         
-        pnl_array = np.array(pnl_values)
+        # Calculate statistics (one moments pass, one selection pass)
+        pnl_mean = pnl_array.mean()
+        pnl_var = np.mean(np.square(pnl_array - pnl_mean))
+        pnl_min, p5, p25, p50, p75, p95, pnl_max = np.percentile(
+            pnl_array, [0, 5, 25, 50, 75, 95, 100]
+        )
         
-        # Calculate statistics
         results = {
             'strategy': hedge_strategy,
             'n_scenarios': n_scenarios,
             'initial_value': initial_value,
-            'pnl_mean': np.mean(pnl_array),
-            'pnl_std': np.std(pnl_array),
-            'pnl_var': np.var(pnl_array),
-            'pnl_min': np.min(pnl_array),
-            'pnl_max': np.max(pnl_array),
+            'pnl_mean': pnl_mean,
+            'pnl_std': np.sqrt(pnl_var),
+            'pnl_var': pnl_var,
+            'pnl_min': pnl_min,
+            'pnl_max': pnl_max,
             'pnl_percentiles': {
-                '5th': np.percentile(pnl_array, 5),
-                '25th': np.percentile(pnl_array, 25),
-                '50th': np.percentile(pnl_array, 50),
-                '75th': np.percentile(pnl_array, 75),
-                '95th': np.percentile(pnl_array, 95),
+                '5th': p5,
+                '25th': p25,
+                '50th': p50,
+                '75th': p75,
+                '95th': p95,
             },
-            'pnl_values': pnl_values,
-            'scenarios': scenarios,
-            'portfolio_greeks': self.calculate_portfolio_greeks(hedged_portfolio)
+            'pnl_values': pnl_array if return_raw else None,
+            'scenarios': scenarios if return_raw else None,
+            'portfolio_greeks': hedged_greeks
         }
         
         return results
@@ -326,7 +553,8 @@ class HedgingSimulator:
         self,
         portfolio: Portfolio,
         n_scenarios: int = 1000,
-        hedge_option_params: OptionParams = None
+        hedge_option_params: OptionParams = None,
+        verbose: bool = False
     ) -> Dict:
         """
         Compare effectiveness of different hedging strategies
@@ -335,73 +563,103 @@ class HedgingSimulator:
             portfolio: Portfolio to hedge
             n_scenarios: Number of scenarios to simulate
             hedge_option_params: Option params for gamma hedging
+            verbose: Print the comparison report (see format_comparison_report)
             
         Returns:
             Comparison results with variance reduction metrics
         """
-        print("=" * 70)
-        print("HEDGING STRATEGY COMPARISON")
-        print("=" * 70)
-        
-        # Simulate each strategy
-        no_hedge = self.simulate_hedging_effectiveness(
-            portfolio, 'none', n_scenarios
-        )
-        
-        delta_hedge = self.simulate_hedging_effectiveness(
-            portfolio, 'delta', n_scenarios
-        )
-        
+        # Simulate each strategy on the same scenarios. They run one after
+        # another: the revaluation kernels are already parallel, and Numba's
+        # workqueue threading layer aborts if they are entered concurrently
+        scenarios = self.generate_scenarios(portfolio, n_scenarios)
+        simulate = self.simulate_hedging_effectiveness
+        
+        no_hedge = simulate(portfolio, 'none', scenarios=scenarios)
+        delta_hedge = simulate(portfolio, 'delta', scenarios=scenarios)
         gamma_hedge = None
         if hedge_option_params:
-            gamma_hedge = self.simulate_hedging_effectiveness(
-                portfolio, 'gamma', n_scenarios, hedge_option_params
+            gamma_hedge = simulate(
+                portfolio, 'gamma', hedge_option_params=hedge_option_params,
+                scenarios=scenarios
             )
         
         # Calculate variance reduction
         base_variance = no_hedge['pnl_var']
-        delta_variance = delta_hedge['pnl_var']
-        delta_reduction = (1 - delta_variance / base_variance) * 100
-        
-        print(f"\nSimulation: {n_scenarios} scenarios")
-        print(f"Initial Portfolio Value: ${no_hedge['initial_value']:.2f}")
-        print("-" * 70)
-        print(f"{'Strategy':<20} {'PnL Std':<15} {'Variance':<15} {'Reduction':<15}")
-        print("-" * 70)
-        print(f"{'No Hedge':<20} ${no_hedge['pnl_std']:<14.2f} ${base_variance:<14.2f} {'—':<15}")
-        print(f"{'Delta Hedge':<20} ${delta_hedge['pnl_std']:<14.2f} ${delta_variance:<14.2f} {delta_reduction:<14.1f}%")
-        
-        if gamma_hedge:
-            gamma_variance = gamma_hedge['pnl_var']
-            gamma_reduction = (1 - gamma_variance / base_variance) * 100
-            print(f"{'Gamma Hedge':<20} ${gamma_hedge['pnl_std']:<14.2f} ${gamma_variance:<14.2f} {gamma_reduction:<14.1f}%")
-        
-        print("-" * 70)
-        
-        # Portfolio Greeks
-        print("\nPortfolio Greeks:")
-        print(f"  No Hedge:    Delta={no_hedge['portfolio_greeks']['delta']:.4f}, "
-              f"Gamma={no_hedge['portfolio_greeks']['gamma']:.4f}")
-        print(f"  Delta Hedge: Delta={delta_hedge['portfolio_greeks']['delta']:.4f}, "
-              f"Gamma={delta_hedge['portfolio_greeks']['gamma']:.4f}")
-        
+        delta_reduction = (1 - delta_hedge['pnl_var'] / base_variance) * 100
+        gamma_reduction = None
         if gamma_hedge:
-            print(f"  Gamma Hedge: Delta={gamma_hedge['portfolio_greeks']['delta']:.4f}, "
-                  f"Gamma={gamma_hedge['portfolio_greeks']['gamma']:.4f}")
-        
-        print("=" * 70)
+            gamma_reduction = (1 - gamma_hedge['pnl_var'] / base_variance) * 100
         
         # Check if target met (≥15% variance reduction)
         target_met = delta_reduction >= 15
-        print(f"\nTarget Met: {'YES' if target_met else 'NO'} "
-              f"(target: ≥15% variance reduction, achieved: {delta_reduction:.1f}%)")
-        print("=" * 70)
         
-        return {
+        results = {
             'no_hedge': no_hedge,
             'delta_hedge': delta_hedge,
             'gamma_hedge': gamma_hedge,
             'delta_variance_reduction': delta_reduction,
-            'gamma_variance_reduction': gamma_reduction if gamma_hedge else None,
+            'gamma_variance_reduction': gamma_reduction,
             'target_met': target_met
         }
+        
+        if verbose:
+            print(format_comparison_report(results))
+        
+        return results
+
+
+def format_comparison_report(results: Dict) -> str:
+    """
+    Format compare_strategies results as a printable report
+    
+    Args:
+        results: Dictionary returned by HedgingSimulator.compare_strategies
+        
+    Returns:
+        Multi-line report with PnL statistics, variance reduction and Greeks
+    """
+    no_hedge = results['no_hedge']
+    delta_hedge = results['delta_hedge']
+    gamma_hedge = results['gamma_hedge']
+    delta_reduction = results['delta_variance_reduction']
+    
+    lines = [
+        "=" * 70,
+        "HEDGING STRATEGY COMPARISON",
+        "=" * 70,
+        f"\nSimulation: {no_hedge['n_scenarios']} scenarios",
+        f"Initial Portfolio Value: ${no_hedge['initial_value']:.2f}",
+        "-" * 70,
+        f"{'Strategy':<20} {'PnL Std':<15} {'Variance':<15} {'Reduction':<15}",
+        "-" * 70,
+        f"{'No Hedge':<20} ${no_hedge['pnl_std']:<14.2f} ${no_hedge['pnl_var']:<14.2f} {'—':<15}",
+        f"{'Delta Hedge':<20} ${delta_hedge['pnl_std']:<14.2f} ${delta_hedge['pnl_var']:<14.2f} {delta_reduction:<14.1f}%",
+    ]
+    
+    if gamma_hedge:
+        gamma_reduction = results['gamma_variance_reduction']
+        lines.append(f"{'Gamma Hedge':<20} ${gamma_hedge['pnl_std']:<14.2f} ${gamma_hedge['pnl_var']:<14.2f} {gamma_reduction:<14.1f}%")
+    
+    lines.append("-" * 70)
+    
+    # Portfolio Greeks
+    lines += [
+        "\nPortfolio Greeks:",
+        f"  No Hedge:    Delta={no_hedge['portfolio_greeks']['delta']:.4f}, "
+        f"Gamma={no_hedge['portfolio_greeks']['gamma']:.4f}",
+        f"  Delta Hedge: Delta={delta_hedge['portfolio_greeks']['delta']:.4f}, "
+        f"Gamma={delta_hedge['portfolio_greeks']['gamma']:.4f}",
+    ]
+    
+    if gamma_hedge:
+        lines.append(f"  Gamma Hedge: Delta={gamma_hedge['portfolio_greeks']['delta']:.4f}, "
+                     f"Gamma={gamma_hedge['portfolio_greeks']['gamma']:.4f}")
+    
+    lines += [
+        "=" * 70,
+        f"\nTarget Met: {'YES' if results['target_met'] else 'NO'} "
+        f"(target: ≥15% variance reduction, achieved: {delta_reduction:.1f}%)",
+        "=" * 70,
+    ]
+    
+    return "\n".join(lines)
@@ -4,15 +4,26 @@ Implements Black-Scholes and Binomial Tree models for European and American opti
 Target accuracy: ≤ 0.5% error vs benchmark data
 """
 
+import math
 import numpy as np
-from scipy.stats import norm
-from typing import Literal, Dict
+from scipy.special import ndtr
+from numba import jit, prange, types
+from typing import Literal, Dict, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+# Standard normal CDF is scipy.special.ndtr (C ufunc, no scipy.stats dispatch);
+# the PDF is evaluated in closed form
+_INV_SQRT_2PI = 0.3989422804014327  # 1 / sqrt(2 * pi)
+
+# Order of the Greeks in tuple-returning helpers
+GREEK_NAMES = ('delta', 'gamma', 'vega', 'theta', 'rho')
+
+
+@dataclass(frozen=True, slots=True)
 class OptionParams:
-    """Parameters for option pricing"""
+    """Parameters for option pricing (immutable and hashable)"""
     spot: float  # Current stock price
     strike: float  # Strike price
     volatility: float  # Annualized volatility (sigma)
@@ -22,6 +33,106 @@ class OptionParams:
     style: Literal['european', 'american'] = 'european'
 
 
+_INV_SQRT_2 = 0.7071067811865476  # 1 / sqrt(2)
+
+
+@jit(types.float64(types.float64), nopython=True, cache=True, fastmath=True)
+def _norm_cdf(x):
+    """Standard normal CDF for compiled code (ndtr via math.erfc)"""
+    return 0.5 * math.erfc(-x * _INV_SQRT_2)
+
+
+@jit(types.float64(types.float64, types.float64, types.float64, types.float64,
+                   types.float64, types.boolean),
+     nopython=True, cache=True, fastmath=True)
+def black_scholes_price(S, K, sigma, r, T, is_call):
+    """
+    Compiled scalar Black-Scholes price, callable from other Numba kernels
+    
+    Args:
+        S: Spot price
+        K: Strike price
+        sigma: Volatility
+        r: Risk-free rate
+        T: Time to maturity
+        is_call: True for call, False for put
+        
+    Returns:
+        Option price
+    """
+    vol_sqrt_T = sigma * math.sqrt(T)
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
+    discounted_K = K * math.exp(-r * T)
+    
+    if is_call:
+        return S * _norm_cdf(d1) - discounted_K * _norm_cdf(d2)
+    return discounted_K * _norm_cdf(-d2) - S * _norm_cdf(-d1)
+
+
+@jit(types.UniTuple(types.float64, 6)(types.float64, types.float64, types.float64,
+                                      types.float64, types.float64, types.boolean),
+     nopython=True, cache=True, fastmath=True)
+def _bs_price_and_greeks(S, K, sigma, r, T, is_call):
+    """
+    Compiled scalar Black-Scholes price and Greeks from one set of d1/d2 terms
+    
+    Args:
+        S: Spot price
+        K: Strike price
+        sigma: Volatility
+        r: Risk-free rate
+        T: Time to maturity
+        is_call: True for call, False for put
+        
+    Returns:
+        Tuple of (price, delta, gamma, vega, theta, rho), scaled as in calculate_greeks
+    """
+    sqrt_T = math.sqrt(T)
+    vol_sqrt_T = sigma * sqrt_T
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
+    
+    # Common terms
+    pdf_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+    cdf_d1 = _norm_cdf(d1)
+    discounted_K = K * math.exp(-r * T)
+    decay = -(S * pdf_d1 * sigma) / (2 * sqrt_T)
+    
+    # Gamma and Vega are the same for calls and puts
+    gamma = pdf_d1 / (S * vol_sqrt_T)
+    vega = S * pdf_d1 * sqrt_T / 100
+    
+    if is_call:
+        cdf_d2 = _norm_cdf(d2)
+        price = S * cdf_d1 - discounted_K * cdf_d2
+        delta = cdf_d1
+        theta = (decay - r * discounted_K * cdf_d2) / 365
+        rho = T * discounted_K * cdf_d2 / 100
+    else:
+        cdf_minus_d2 = _norm_cdf(-d2)
+        price = discounted_K * cdf_minus_d2 - S * _norm_cdf(-d1)
+        delta = cdf_d1 - 1.0
+        theta = (decay + r * discounted_K * cdf_minus_d2) / 365
+        rho = -T * discounted_K * cdf_minus_d2 / 100
+    
+    return price, delta, gamma, vega, theta, rho
+
+
+@lru_cache(maxsize=4096)
+def _bs_price_and_greeks_cached(
+    S: float, K: float, sigma: float, r: float, T: float,
+    option_type: Literal['call', 'put']
+) -> Tuple[float, float, float, float, float, float]:
+    """
+    Black-Scholes price and Greeks, memoized on the scalar inputs
+    
+    Returns:
+        Tuple of (price, delta, gamma, vega, theta, rho)
+    """
+    return _bs_price_and_greeks(S, K, sigma, r, T, option_type == 'call')
+
+
 class BlackScholesModel:
     """
     Black-Scholes model for European option pricing
@@ -50,9 +161,9 @@ class BlackScholesModel:
         d2 = d1 - sigma * np.sqrt(T)
         
         if params.option_type == 'call':
-            price = S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+            price = S * ndtr(d1) - K * np.exp(-r * T) * ndtr(d2)
         else:  # put
-            price = K * np.exp(-r * T) * norm.cdf(-d2) - S * norm.cdf(-d1)
+            price = K * np.exp(-r * T) * ndtr(-d2) - S * ndtr(-d1)
         
         return price
     
@@ -67,54 +178,310 @@ class BlackScholesModel:
         Returns:
             Dictionary with Greek values
         """
-        S = params.spot
-        K = params.strike
-        sigma = params.volatility
-        r = params.rate
-        T = params.maturity
+        return BlackScholesModel.price_and_greeks(params)[1]
+    
+    @staticmethod
+    def price_and_greeks(params: OptionParams) -> Tuple[float, Dict[str, float]]:
+        """
+        Calculate option price and Greeks together, sharing d1/d2 and the CDFs
         
-        # Calculate d1 and d2
+        Args:
+            params: OptionParams with pricing parameters
+            
+        Returns:
+            Tuple of (price, dictionary with Greek values)
+        """
+        price, *greeks = _bs_price_and_greeks_cached(
+            params.spot, params.strike, params.volatility,
+            params.rate, params.maturity, params.option_type
+        )
+        return price, dict(zip(GREEK_NAMES, greeks))
+
+    @staticmethod
+    def delta_vectorized(
+        S: np.ndarray,
+        K: float,
+        sigma: float,
+        r: float,
+        T: np.ndarray,
+        option_type: Literal['call', 'put']
+    ) -> np.ndarray:
+        """
+        Calculate Delta over arrays of spot prices and maturities
+
+        Args:
+            S: Array of spot prices
+            K: Strike price
+            sigma: Volatility
+            r: Risk-free rate
+            T: Array of maturities (broadcastable against S)
+            option_type: 'call' or 'put'
+
+        Returns:
+            Array of Delta values with the broadcast shape of S and T
+        """
         d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+
+        if option_type == 'call':
+            return ndtr(d1)
+        return ndtr(d1) - 1
+
+    @staticmethod
+    def price_vec(
+        S: np.ndarray,
+        K: np.ndarray,
+        sigma: np.ndarray,
+        r: np.ndarray,
+        T: np.ndarray,
+        option_type: Literal['call', 'put']
+    ) -> np.ndarray:
+        """
+        Calculate Black-Scholes prices over arrays of market states
+
+        Args:
+            S: Array of spot prices
+            K: Strike price(s) (broadcastable against S)
+            sigma: Array of volatilities (broadcastable against S)
+            r: Risk-free rate(s) (broadcastable against S)
+            T: Array of maturities (broadcastable against S)
+            option_type: 'call' or 'put'
+
+        Returns:
+            Array of option prices with the broadcast shape of the inputs
+        """
+        vol_sqrt_T = sigma * np.sqrt(T)
+        d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / vol_sqrt_T
+        d2 = d1 - vol_sqrt_T
+        discounted_K = K * np.exp(-r * T)
+
+        if option_type == 'call':
+            return S * ndtr(d1) - discounted_K * ndtr(d2)
+        return discounted_K * ndtr(-d2) - S * ndtr(-d1)
+
+
+# Kernel array inputs are declared read-only so cached (non-writeable) grids
+# can be passed in; writeable arrays convert implicitly
+_readonly_1d = types.Array(types.float64, 1, 'A', readonly=True)
+
+
+@jit(types.float64[:](_readonly_1d, types.float64, types.float64, types.float64,
+                      _readonly_1d, types.boolean),
+     nopython=True, parallel=True, cache=True, fastmath=True)
+def black_scholes_delta(S, K, sigma, r, T, is_call):
+    """
+    Compiled Black-Scholes Delta over flat arrays of spots and maturities
+    
+    Args:
+        S: 1-D array of spot prices
+        K: Strike price
+        sigma: Volatility
+        r: Risk-free rate
+        T: 1-D array of maturities (same length as S)
+        is_call: True for call, False for put
         
-        # Common terms
-        pdf_d1 = norm.pdf(d1)
-        cdf_d1 = norm.cdf(d1)
-        cdf_d2 = norm.cdf(d2)
+    Returns:
+        Array of Delta values
+    """
+    n = S.shape[0]
+    delta = np.empty(n)
+    
+    for i in prange(n):
+        d1 = (math.log(S[i] / K) + (r + 0.5 * sigma * sigma) * T[i]) / (sigma * math.sqrt(T[i]))
+        cdf_d1 = 0.5 * (1.0 + math.erf(d1 * _INV_SQRT_2))
         
-        # Delta
-        if params.option_type == 'call':
-            delta = cdf_d1
+        if is_call:
+            delta[i] = cdf_d1
         else:
-            delta = cdf_d1 - 1
+            delta[i] = cdf_d1 - 1.0
+    
+    return delta
+
+
+@jit(types.float64[:, :](_readonly_1d, types.float64, types.float64, types.float64,
+                         _readonly_1d, types.boolean),
+     nopython=True, parallel=True, cache=True, fastmath=True)
+def black_scholes_delta_surface(S, K, sigma, r, T, is_call):
+    """
+    Compiled Black-Scholes Delta over a maturity x spot grid
+    
+    Args:
+        S: 1-D array of spot prices (grid columns)
+        K: Strike price
+        sigma: Volatility
+        r: Risk-free rate
+        T: 1-D array of maturities (grid rows)
+        is_call: True for call, False for put
         
-        # Gamma (same for calls and puts)
-        gamma = pdf_d1 / (S * sigma * np.sqrt(T))
+    Returns:
+        Array of shape (len(T), len(S)) with Delta values
+    """
+    n_t = T.shape[0]
+    n_s = S.shape[0]
+    surface = np.empty((n_t, n_s))
+    
+    for i in prange(n_t):
+        drift = (r + 0.5 * sigma * sigma) * T[i]
+        vol_sqrt_T = sigma * math.sqrt(T[i])
+        
+        for j in range(n_s):
+            d1 = (math.log(S[j] / K) + drift) / vol_sqrt_T
+            cdf_d1 = 0.5 * (1.0 + math.erf(d1 * _INV_SQRT_2))
+            
+            if is_call:
+                surface[i, j] = cdf_d1
+            else:
+                surface[i, j] = cdf_d1 - 1.0
+    
+    return surface
+
+
+def _delta_kernel_matches_reference() -> bool:
+    """Check the compiled Delta kernels against the NumPy closed form"""
+    S = np.array([80.0, 100.0, 125.0])
+    T = np.array([0.1, 1.0, 2.5])
+    S_grid, T_grid = np.meshgrid(S, T)
+    
+    for option_type in ('call', 'put'):
+        is_call = option_type == 'call'
         
-        # Vega (same for calls and puts, divided by 100 for 1% change)
-        vega = S * pdf_d1 * np.sqrt(T) / 100
+        expected = BlackScholesModel.delta_vectorized(S, 100.0, 0.2, 0.05, T, option_type)
+        computed = black_scholes_delta(S, 100.0, 0.2, 0.05, T, is_call)
+        if not np.allclose(computed, expected, rtol=0.0, atol=1e-10):
+            return False
         
-        # Theta (per day, divided by 365)
-        if params.option_type == 'call':
-            theta = (-(S * pdf_d1 * sigma) / (2 * np.sqrt(T)) 
-                    - r * K * np.exp(-r * T) * cdf_d2) / 365
-        else:
-            theta = (-(S * pdf_d1 * sigma) / (2 * np.sqrt(T)) 
-                    + r * K * np.exp(-r * T) * norm.cdf(-d2)) / 365
+        expected = BlackScholesModel.delta_vectorized(S_grid, 100.0, 0.2, 0.05, T_grid, option_type)
+        computed = black_scholes_delta_surface(S, 100.0, 0.2, 0.05, T, is_call)
+        if not np.allclose(computed, expected, rtol=0.0, atol=1e-10):
+            return False
+    
+    return True
+
+
+# Validated once at import; callers fall back to NumPy if the kernel is off
+DELTA_KERNEL_OK = _delta_kernel_matches_reference()
+
+
+def delta_batch(S, K: float, sigma: float, r: float, T, is_call: bool) -> np.ndarray:
+    """
+    Black-Scholes Delta for broadcastable arrays of spots and maturities
+
+    Dispatches to the compiled kernels when they passed the import check,
+    and to the NumPy closed form otherwise. A row of spots against a column
+    of maturities is evaluated as a grid without materialising the meshgrid.
+
+    Args:
+        S: Spot prices (scalar or array)
+        K: Strike price
+        sigma: Volatility
+        r: Risk-free rate
+        T: Times to maturity, broadcastable against S
+        is_call: True for call, False for put
+
+    Returns:
+        Array of Delta values with the broadcast shape of S and T
+    """
+    S = np.asarray(S, dtype=np.float64)
+    T = np.asarray(T, dtype=np.float64)
+
+    if not DELTA_KERNEL_OK:
+        option_type = 'call' if is_call else 'put'
+        return BlackScholesModel.delta_vectorized(S, K, sigma, r, T, option_type)
+
+    K, sigma, r, is_call = float(K), float(sigma), float(r), bool(is_call)
+
+    if S.ndim == 2 and T.ndim == 2 and S.shape[0] == 1 and T.shape[1] == 1:
+        return black_scholes_delta_surface(S[0], K, sigma, r, T[:, 0], is_call)
+
+    S_b, T_b = np.broadcast_arrays(S, T)
+    delta = black_scholes_delta(S_b.ravel(), K, sigma, r, T_b.ravel(), is_call)
+    return delta.reshape(S_b.shape)
+
+
+@jit(types.float64(types.float64, types.float64, types.float64, types.float64,
+                   types.float64, types.int64, types.boolean, types.boolean),
+     nopython=True, nogil=True, cache=True, fastmath=True)
+def _binomial_price(S, K, sigma, r, T, N, is_call, is_american):
+    """
+    Compiled CRR binomial tree with optional early exercise
+    
+    Args:
+        S: Spot price
+        K: Strike price
+        sigma: Volatility
+        r: Risk-free rate
+        T: Time to maturity
+        N: Number of time steps
+        is_call: True for call, False for put
+        is_american: True to allow early exercise at every node
         
-        # Rho (divided by 100 for 1% change)
-        if params.option_type == 'call':
-            rho = K * T * np.exp(-r * T) * cdf_d2 / 100
+    Returns:
+        Option price
+    """
+    dt = T / N
+    log_u = sigma * math.sqrt(dt)  # Log of the up factor
+    u = math.exp(log_u)  # Up factor
+    d = 1.0 / u  # Down factor
+    p = (math.exp(r * dt) - d) / (u - d)  # Risk-neutral probability
+    discount = math.exp(-r * dt)
+    down_ratio = math.exp(-2.0 * log_u)  # Asset price ratio between neighbouring nodes of a level
+    
+    # Option values at maturity, sweeping asset prices from the top node down;
+    # this single buffer is reused for every level of the induction
+    option_values = np.empty(N + 1)
+    top_price = S * math.exp(N * log_u)
+    asset_price = top_price
+    for i in range(N + 1):
+        if is_call:
+            option_values[i] = max(asset_price - K, 0.0)
         else:
-            rho = -K * T * np.exp(-r * T) * norm.cdf(-d2) / 100
+            option_values[i] = max(K - asset_price, 0.0)
+        asset_price *= down_ratio
+    
+    # Backward induction through the tree, in place
+    for step in range(N - 1, -1, -1):
+        top_price *= d  # Top node of this level is S * u**step
+        asset_price = top_price
+        for i in range(step + 1):
+            option_values[i] = discount * (p * option_values[i] + (1.0 - p) * option_values[i + 1])
+            
+            # For American options, check early exercise
+            if is_american:
+                if is_call:
+                    intrinsic = asset_price - K
+                else:
+                    intrinsic = K - asset_price
+                if intrinsic > option_values[i]:
+                    option_values[i] = intrinsic
+                asset_price *= down_ratio
+    
+    return option_values[0]
+
+
+@jit(types.float64[:](types.float64[:, :], types.int64, types.boolean, types.boolean),
+     nopython=True, nogil=True, parallel=True, cache=True)
+def _binomial_price_batch(params_array, N, is_call, is_american):
+    """
+    Price several binomial trees in parallel
+    
+    Args:
+        params_array: Array of shape (M, 5) with rows of (S, K, sigma, r, T)
+        N: Number of time steps
+        is_call: True for call, False for put
+        is_american: True to allow early exercise at every node
         
-        return {
-            'delta': delta,
-            'gamma': gamma,
-            'vega': vega,
-            'theta': theta,
-            'rho': rho
-        }
+    Returns:
+        Array of M option prices
+    """
+    n = params_array.shape[0]
+    prices = np.empty(n)
+    
+    for i in prange(n):
+        prices[i] = _binomial_price(
+            params_array[i, 0], params_array[i, 1], params_array[i, 2],
+            params_array[i, 3], params_array[i, 4], N, is_call, is_american
+        )
+    
+    return prices
 
 
 class BinomialTreeModel:
@@ -142,47 +509,11 @@ class BinomialTreeModel:
         Returns:
             Option price
         """
-        S = params.spot
-        K = params.strike
-        sigma = params.volatility
-        r = params.rate
-        T = params.maturity
-        N = self.steps
-        
-        # Calculate parameters
-        dt = T / N
-        u = np.exp(sigma * np.sqrt(dt))  # Up factor
-        d = 1 / u  # Down factor
-        p = (np.exp(r * dt) - d) / (u - d)  # Risk-neutral probability
-        discount = np.exp(-r * dt)
-        
-        # Initialize asset prices at maturity
-        asset_prices = np.zeros(N + 1)
-        for i in range(N + 1):
-            asset_prices[i] = S * (u ** (N - i)) * (d ** i)
-        
-        # Initialize option values at maturity
-        if params.option_type == 'call':
-            option_values = np.maximum(asset_prices - K, 0)
-        else:
-            option_values = np.maximum(K - asset_prices, 0)
-        
-        # Backward induction through the tree
-        for step in range(N - 1, -1, -1):
-            for i in range(step + 1):
-                # Calculate option value from next period
-                option_values[i] = discount * (p * option_values[i] + (1 - p) * option_values[i + 1])
-                
-                # For American options, check early exercise
-                if params.style == 'american':
-                    asset_price = S * (u ** (step - i)) * (d ** i)
-                    if params.option_type == 'call':
-                        intrinsic = max(asset_price - K, 0)
-                    else:
-                        intrinsic = max(K - asset_price, 0)
-                    option_values[i] = max(option_values[i], intrinsic)
-        
-        return option_values[0]
+        return _binomial_price(
+            params.spot, params.strike, params.volatility, params.rate,
+            params.maturity, self.steps,
+            params.option_type == 'call', params.style == 'american'
+        )
 
 
 class OptionsPricingEngine:
@@ -225,44 +556,90 @@ class OptionsPricingEngine:
             return self.bs_model.calculate_greeks(params)
         else:
             # For American options, use numerical approximation
-            return self._numerical_greeks(params)
+            return self._numerical_price_and_greeks(params)[1]
     
-    def _numerical_greeks(self, params: OptionParams) -> Dict[str, float]:
+    def greeks_array(self, params: OptionParams) -> np.ndarray:
         """
-        Calculate Greeks numerically for American options
+        Calculate Greeks for an option as an array
+        
+        Args:
+            params: OptionParams with pricing parameters
+            
+        Returns:
+            Array of Greek values ordered as GREEK_NAMES
         """
-        base_price = self.binomial_model.price(params)
+        if params.style == 'european':
+            return np.array(_bs_price_and_greeks_cached(
+                params.spot, params.strike, params.volatility,
+                params.rate, params.maturity, params.option_type
+            )[1:])
+        else:
+            greeks = self._numerical_price_and_greeks(params)[1]
+            return np.array([greeks[name] for name in GREEK_NAMES])
+    
+    def price_and_greeks(self, params: OptionParams) -> Tuple[float, Dict[str, float]]:
+        """
+        Price an option and calculate its Greeks in one pass
+        
+        Args:
+            params: OptionParams with pricing parameters
+            
+        Returns:
+            Tuple of (price, dictionary with Greek values)
+        """
+        if params.style == 'european':
+            return self.bs_model.price_and_greeks(params)
+        else:
+            # The base tree of the bump batch is the price
+            return self._numerical_price_and_greeks(params)
+    
+    def _numerical_price_and_greeks(self, params: OptionParams) -> Tuple[float, Dict[str, float]]:
+        """
+        Calculate price and Greeks numerically for American options
+        """
+        S = params.spot
+        K = params.strike
+        sigma = params.volatility
+        r = params.rate
+        T = params.maturity
+        
+        h = 0.01 * S  # Spot bump
+        h_vol = 0.01  # Volatility bump (1%)
+        h_time = 1 / 365  # Time decay (1 day)
+        h_rate = 0.01  # Rate bump (1%)
+        has_theta = T > h_time
+        
+        # Base and bumped trees, priced in one parallel batch
+        bumped = np.array([
+            [S, K, sigma, r, T],
+            [S + h, K, sigma, r, T],
+            [S - h, K, sigma, r, T],
+            [S, K, sigma + h_vol, r, T],
+            [S, K, sigma, r, T - h_time if has_theta else T],
+            [S, K, sigma, r + h_rate, T],
+        ])
+        base_price, price_up, price_down, price_vol_up, price_time, price_rate_up = \
+            _binomial_price_batch(
+                bumped, self.binomial_model.steps,
+                params.option_type == 'call', params.style == 'american'
+            )
         
         # Delta: dV/dS
-        h = 0.01 * params.spot
-        params_up = OptionParams(**{**params.__dict__, 'spot': params.spot + h})
-        params_down = OptionParams(**{**params.__dict__, 'spot': params.spot - h})
-        delta = (self.binomial_model.price(params_up) - self.binomial_model.price(params_down)) / (2 * h)
+        delta = (price_up - price_down) / (2 * h)
         
         # Gamma: d²V/dS²
-        price_up = self.binomial_model.price(params_up)
-        price_down = self.binomial_model.price(params_down)
         gamma = (price_up - 2 * base_price + price_down) / (h ** 2)
         
         # Vega: dV/dσ (per 1% change)
-        h_vol = 0.01
-        params_vol_up = OptionParams(**{**params.__dict__, 'volatility': params.volatility + h_vol})
-        vega = (self.binomial_model.price(params_vol_up) - base_price) / 1
+        vega = (price_vol_up - base_price) / 1
         
         # Theta: dV/dt (per day)
-        h_time = 1 / 365
-        if params.maturity > h_time:
-            params_time = OptionParams(**{**params.__dict__, 'maturity': params.maturity - h_time})
-            theta = self.binomial_model.price(params_time) - base_price
-        else:
-            theta = 0
+        theta = price_time - base_price if has_theta else 0
         
         # Rho: dV/dr (per 1% change)
-        h_rate = 0.01
-        params_rate_up = OptionParams(**{**params.__dict__, 'rate': params.rate + h_rate})
-        rho = (self.binomial_model.price(params_rate_up) - base_price) / 1
+        rho = (price_rate_up - base_price) / 1
         
-        return {
+        return base_price, {
             'delta': delta,
             'gamma': gamma,
             'vega': vega,
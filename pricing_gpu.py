@@ -0,0 +1,86 @@
+"""
+Optional CUDA backend for Monte Carlo path simulation
+One GPU thread per path; each thread keeps its log-price in a register
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import cuda
+    from numba.cuda.random import create_xoroshiro128p_states, xoroshiro128p_normal_float32
+except ImportError:  # numba built without CUDA support
+    cuda = None
+
+
+THREADS_PER_BLOCK = 256
+
+
+def is_available() -> bool:
+    """True if a usable CUDA device is present"""
+    try:
+        return cuda is not None and cuda.is_available()
+    except Exception:
+        return False
+
+
+if cuda is not None:
+    @cuda.jit
+    def _mc_kernel(log_S0, drift, vol, n_steps, rng_states, exp_at_end, out):
+        """
+        Accumulate one GBM log-price path per thread
+
+        out is time-major (n_steps+1, n_paths) so threads of a warp write
+        adjacent addresses at every step.
+        """
+        tid = cuda.grid(1)
+        if tid >= out.shape[1]:
+            return
+
+        s = log_S0
+        out[0, tid] = math.exp(s) if exp_at_end else s
+        for j in range(n_steps):
+            z = xoroshiro128p_normal_float32(rng_states, tid)
+            s += drift + vol * z
+            out[j + 1, tid] = math.exp(s) if exp_at_end else s
+
+
+def monte_carlo_log_paths_gpu(S0, sigma, r, T, n_paths, n_steps, seed=None,
+                              exp_at_end=False, to_host=True):
+    """
+    Monte Carlo log-price paths on the GPU, time-major float32
+
+    Args:
+        S0: Initial spot price
+        sigma: Volatility
+        r: Risk-free rate
+        T: Time horizon
+        n_paths: Number of simulation paths
+        n_steps: Number of time steps
+        seed: Optional seed for the xoroshiro128+ states (default: random)
+        exp_at_end: Return prices instead of log prices
+        to_host: Copy the result back to a NumPy array; if False the device
+            array is returned for further reductions on the GPU
+
+    Returns:
+        float32 array (or device array) of shape (n_steps+1, n_paths)
+    """
+    if not is_available():
+        raise RuntimeError("CUDA backend requested but no CUDA device is available")
+
+    if seed is None:
+        seed = int(np.random.default_rng().integers(0, 2**63))
+
+    dt = T / n_steps
+    rng_states = create_xoroshiro128p_states(n_paths, seed=seed)
+    out = cuda.device_array((n_steps + 1, n_paths), dtype=np.float32)
+
+    blocks = (n_paths + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+    _mc_kernel[blocks, THREADS_PER_BLOCK](
+        np.float32(math.log(S0)),
+        np.float32((r - 0.5 * sigma**2) * dt),
+        np.float32(sigma * math.sqrt(dt)),
+        n_steps, rng_states, exp_at_end, out
+    )
+
+    return out.copy_to_host() if to_host else out
@@ -4,16 +4,21 @@ Uses NumPy vectorization and Numba JIT compilation
 Target: 40% faster than baseline, 10,000 paths in < 2s
 """
 
+import math
 import numpy as np
-from scipy.stats import norm
-from numba import jit, prange
-from typing import Literal, Dict
+from numba import jit, prange, types
+from typing import Literal, Dict, NamedTuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+# Shared generator for Monte Carlo draws (created once, reused across calls)
+_rng = np.random.default_rng()
+
+
+@dataclass(frozen=True, slots=True)
 class OptionParams:
-    """Parameters for option pricing"""
+    """Parameters for option pricing (immutable and hashable)"""
     spot: float
     strike: float
     volatility: float
@@ -23,19 +28,107 @@ class OptionParams:
     style: Literal['european', 'american'] = 'european'
 
 
-@jit(nopython=True, cache=True)
+class Greeks(NamedTuple):
+    """
+    Option Greeks, as returned by OptimizedPricingEngine.greeks
+    
+    A plain tuple underneath; fields are read as attributes (greeks.delta),
+    by position, or by field name (greeks['delta'], 'delta' in greeks,
+    greeks.get('delta')). Unknown names raise KeyError. Use _asdict() when
+    an actual dict is needed.
+    """
+    delta: float
+    gamma: float
+    vega: float
+    theta: float
+    rho: float
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key in self._fields:
+                return getattr(self, key)
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return key in self._fields
+        return tuple.__contains__(self, key)
+
+    def get(self, key, default=None):
+        """Field value by name, or default if there is no such Greek"""
+        return self[key] if key in self._fields else default
+
+
+SQRT_2_INV = 0.7071067811865476  # 1 / sqrt(2)
+SQRT_2PI_INV = 0.3989422804014327  # 1 / sqrt(2 * pi)
+
+# Below this many elements the serial kernels beat prange's thread dispatch
+PARALLEL_THRESHOLD = 2048
+
+# backend='auto' moves Monte Carlo to the GPU above this many path-steps
+GPU_THRESHOLD = 1_000_000
+
+# Kernel array inputs are declared read-only so non-writeable arrays can be
+# passed in; writeable arrays convert implicitly
+_readonly_1d = types.Array(types.float64, 1, 'A', readonly=True)
+
+# Log-path kernels compute and store in float64 or, for dtype=np.float32,
+# fully in float32
+_LOG_PATH_SIGNATURES = [
+    types.Array(ftype, 2, 'C')(ftype, ftype, ftype, types.Array(ftype, 2, 'C', readonly=True),
+                               types.int64)
+    for ftype in (types.float64, types.float32)
+]
+
+
+@jit(types.float64(types.float64), nopython=True, cache=True, fastmath=True)
 def norm_cdf(x):
-    """Fast approximation of cumulative normal distribution"""
-    return 0.5 * (1.0 + np.tanh(np.sqrt(2.0 / np.pi) * (x + 0.044715 * x**3)))
+    """
+    Fast cumulative normal distribution
+    
+    Abramowitz & Stegun 7.1.26 rational approximation of erf (one exp,
+    absolute error < 1.5e-7)
+    """
+    sign = 1.0 if x >= 0.0 else -1.0
+    a = abs(x) * SQRT_2_INV
+    t = 1.0 / (1.0 + 0.3275911 * a)
+    poly = ((((1.061405429 * t - 1.453152027) * t + 1.421413741) * t
+             - 0.284496736) * t + 0.254829592) * t
+    erf_a = 1.0 - poly * math.exp(-a * a)
+    return 0.5 * (1.0 + sign * erf_a)
 
 
-@jit(nopython=True, cache=True)
+@jit(types.float64(types.float64), nopython=True, cache=True, fastmath=True)
 def norm_pdf(x):
-    """Fast approximation of normal probability density function"""
-    return np.exp(-0.5 * x**2) / np.sqrt(2.0 * np.pi)
+    """Normal probability density function"""
+    return math.exp(-0.5 * x * x) * SQRT_2PI_INV
+
+
+@jit(types.UniTuple(types.float64, 2)(types.float64), nopython=True, cache=True, fastmath=True)
+def norm_cdf_pdf(x):
+    """
+    Normal CDF and PDF at the same point from a single exp
+    
+    The erf approximation in norm_cdf needs exp(-x^2 / 2), which is also the
+    density's only transcendental, so both come out of one evaluation.
+    
+    Returns:
+        Tuple of (cdf, pdf)
+    """
+    sign = 1.0 if x >= 0.0 else -1.0
+    a = abs(x) * SQRT_2_INV
+    t = 1.0 / (1.0 + 0.3275911 * a)
+    poly = ((((1.061405429 * t - 1.453152027) * t + 1.421413741) * t
+             - 0.284496736) * t + 0.254829592) * t
+    gauss = math.exp(-a * a)
+    cdf = 0.5 * (1.0 + sign * (1.0 - poly * gauss))
+    return cdf, gauss * SQRT_2PI_INV
 
 
-@jit(nopython=True, cache=True)
+@jit(types.float64(types.float64, types.float64, types.float64, types.float64,
+                   types.float64, types.boolean),
+     nopython=True, cache=True, fastmath=True)
 def black_scholes_price(S, K, sigma, r, T, is_call):
     """
     Optimized Black-Scholes pricing with Numba JIT
@@ -51,18 +144,22 @@ def black_scholes_price(S, K, sigma, r, T, is_call):
     Returns:
         Option price
     """
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    vol_sqrt_T = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
+    discounted_K = K * np.exp(-r * T)
     
     if is_call:
-        price = S * norm_cdf(d1) - K * np.exp(-r * T) * norm_cdf(d2)
+        price = S * norm_cdf(d1) - discounted_K * norm_cdf(d2)
     else:
-        price = K * np.exp(-r * T) * norm_cdf(-d2) - S * norm_cdf(-d1)
+        price = discounted_K * norm_cdf(-d2) - S * norm_cdf(-d1)
     
     return price
 
 
-@jit(nopython=True, cache=True)
+@jit(types.UniTuple(types.float64, 5)(types.float64, types.float64, types.float64,
+                                      types.float64, types.float64, types.boolean),
+     nopython=True, cache=True, fastmath=True)
 def black_scholes_greeks(S, K, sigma, r, T, is_call):
     """
     Optimized Greeks calculation with Numba JIT
@@ -70,47 +167,51 @@ def black_scholes_greeks(S, K, sigma, r, T, is_call):
     Returns:
         Tuple of (delta, gamma, vega, theta, rho)
     """
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
+    sqrt_T = np.sqrt(T)
+    vol_sqrt_T = sigma * sqrt_T
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
+    discounted_K = K * np.exp(-r * T)
     
-    pdf_d1 = norm_pdf(d1)
-    cdf_d1 = norm_cdf(d1)
+    # Two exps in total: N(-x) = 1 - N(x) covers the put terms
+    cdf_d1, pdf_d1 = norm_cdf_pdf(d1)
     cdf_d2 = norm_cdf(d2)
     
+    # Put formulas are the call ones with N(d) replaced by N(d) - 1
+    put_shift = 0.0 if is_call else 1.0
+    n_d1 = cdf_d1 - put_shift
+    n_d2 = cdf_d2 - put_shift
+    
     # Delta
-    if is_call:
-        delta = cdf_d1
-    else:
-        delta = cdf_d1 - 1.0
+    delta = n_d1
     
     # Gamma (same for calls and puts)
-    gamma = pdf_d1 / (S * sigma * np.sqrt(T))
+    gamma = pdf_d1 / (S * vol_sqrt_T)
     
     # Vega (per 1% change)
-    vega = S * pdf_d1 * np.sqrt(T) / 100.0
+    vega = S * pdf_d1 * sqrt_T / 100.0
     
     # Theta (per day)
-    if is_call:
-        theta = (-(S * pdf_d1 * sigma) / (2.0 * np.sqrt(T)) 
-                - r * K * np.exp(-r * T) * cdf_d2) / 365.0
-    else:
-        theta = (-(S * pdf_d1 * sigma) / (2.0 * np.sqrt(T)) 
-                + r * K * np.exp(-r * T) * norm_cdf(-d2)) / 365.0
+    theta = (-(S * pdf_d1 * sigma) / (2.0 * sqrt_T) - r * discounted_K * n_d2) / 365.0
     
     # Rho (per 1% change)
-    if is_call:
-        rho = K * T * np.exp(-r * T) * cdf_d2 / 100.0
-    else:
-        rho = -K * T * np.exp(-r * T) * norm_cdf(-d2) / 100.0
+    rho = T * discounted_K * n_d2 / 100.0
     
     return delta, gamma, vega, theta, rho
 
 
-@jit(nopython=True, cache=True)
+@jit(types.float64(types.float64, types.float64, types.float64, types.float64,
+                   types.float64, types.int64, types.boolean, types.boolean),
+     nopython=True, cache=True, fastmath=True)
 def binomial_tree_price(S, K, sigma, r, T, N, is_call, is_american):
     """
     Optimized binomial tree pricing with Numba JIT
     
+    European options return the closed-form Black-Scholes price, which the
+    tree only approximates with O(1/N) bias. For American options each level
+    of backward induction is a branchless fused multiply-add sweep with a max
+    against the rolled intrinsic value, which LLVM can vectorize.
+    
     Args:
         S: Spot price
         K: Strike price
@@ -124,45 +225,249 @@ def binomial_tree_price(S, K, sigma, r, T, N, is_call, is_american):
     Returns:
         Option price
     """
+    if not is_american:
+        return black_scholes_price(S, K, sigma, r, T, is_call)
+    
     dt = T / N
     u = np.exp(sigma * np.sqrt(dt))
     d = 1.0 / u
     p = (np.exp(r * dt) - d) / (u - d)
     discount = np.exp(-r * dt)
+    disc_p = discount * p
+    disc_1mp = discount * (1.0 - p)
+    down_ratio = d / u
+    # Payoff is max(omega * (S - K), 0) for both calls and puts
+    omega = 1.0 if is_call else -1.0
     
-    # Initialize asset prices at maturity
-    asset_prices = np.zeros(N + 1)
-    for i in range(N + 1):
-        asset_prices[i] = S * (u ** (N - i)) * (d ** i)
+    # Asset prices at maturity, from the top node down
+    asset_prices = np.empty(N + 1)
+    asset_prices[0] = S * u ** N
+    for i in range(1, N + 1):
+        asset_prices[i] = asset_prices[i - 1] * down_ratio
     
     # Initialize option values at maturity
-    option_values = np.zeros(N + 1)
+    option_values = np.empty(N + 1)
     for i in range(N + 1):
-        if is_call:
-            option_values[i] = max(asset_prices[i] - K, 0.0)
-        else:
-            option_values[i] = max(K - asset_prices[i], 0.0)
+        option_values[i] = max(omega * (asset_prices[i] - K), 0.0)
     
-    # Backward induction
+    # Backward induction with early exercise
     for step in range(N - 1, -1, -1):
         for i in range(step + 1):
-            option_values[i] = discount * (p * option_values[i] + (1.0 - p) * option_values[i + 1])
-            
-            if is_american:
-                asset_price = S * (u ** (step - i)) * (d ** i)
-                if is_call:
-                    intrinsic = max(asset_price - K, 0.0)
-                else:
-                    intrinsic = max(K - asset_price, 0.0)
-                option_values[i] = max(option_values[i], intrinsic)
+            # Node (step, i) sits one down-move below node (step + 1, i)
+            asset_prices[i] *= d
+            continuation = disc_p * option_values[i] + disc_1mp * option_values[i + 1]
+            option_values[i] = max(continuation, omega * (asset_prices[i] - K))
     
     return option_values[0]
 
 
-@jit(nopython=True, parallel=True, cache=True)
-def monte_carlo_paths(S0, sigma, r, T, n_paths, n_steps):
+@jit(types.float64[:](types.float64, types.float64, types.float64, types.float64,
+                      types.float64, types.int64, types.boolean, types.float64,
+                      types.float64, types.float64, types.float64),
+     nopython=True, parallel=True, cache=True, fastmath=True)
+def _numerical_greeks_batched(S, K, sigma, r, T, N, is_call, h_s, h_vol, h_t, h_r):
+    """
+    Price the base American tree and its five bumped variants in parallel
+    
+    Args:
+        S, K, sigma, r, T: Base option parameters
+        N: Number of tree steps
+        is_call: True for call, False for put
+        h_s: Spot bump
+        h_vol: Volatility bump
+        h_t: Time decay step (ignored when T <= h_t)
+        h_r: Rate bump
+        
+    Returns:
+        Array of prices: base, spot up, spot down, vol up, time down, rate up
+    """
+    T_decay = T - h_t if T > h_t else T
+    prices = np.empty(6)
+    
+    for k in prange(6):
+        S_k = S + h_s if k == 1 else (S - h_s if k == 2 else S)
+        sigma_k = sigma + h_vol if k == 3 else sigma
+        T_k = T_decay if k == 4 else T
+        r_k = r + h_r if k == 5 else r
+        prices[k] = binomial_tree_price(S_k, K, sigma_k, r_k, T_k, N, is_call, True)
+    
+    return prices
+
+
+@jit(_LOG_PATH_SIGNATURES, nopython=True, parallel=True, cache=True, fastmath=True)
+def _antithetic_log_paths_par(log_S0, drift, vol, Z, n_paths):
+    """
+    Accumulate GBM log-price paths from pre-drawn normals and their mirror
+    
+    Paths are stored time-major so each step writes one contiguous row
+    across all paths. The parallel variant splits each row across threads;
+    _antithetic_log_paths_ser is the same loop without threading, for small
+    path counts where thread dispatch costs more than it saves.
+    
+    Args:
+        log_S0: Log of the initial spot price
+        drift: Per-step log drift, (r - sigma^2 / 2) * dt
+        vol: Per-step log volatility, sigma * sqrt(dt)
+        Z: C-contiguous standard normals of shape (n_steps, ceil(n_paths / 2))
+        n_paths: Number of simulation paths
+        
+    Returns:
+        Array of Z's dtype and shape (n_steps+1, n_paths); columns
+        [0, Z.shape[1]) use +Z and the remaining columns use -Z
+    """
+    n_steps, n_half = Z.shape
+    n_mirror = n_paths - n_half
+    log_paths = np.empty((n_steps + 1, n_paths), dtype=Z.dtype)
+    log_paths[0, :] = log_S0
+    
+    for j in range(n_steps):
+        # Parallel across paths within the step
+        for i in prange(n_half):
+            shock = vol * Z[j, i]
+            log_paths[j + 1, i] = log_paths[j, i] + drift + shock
+            if i < n_mirror:
+                log_paths[j + 1, n_half + i] = log_paths[j, n_half + i] + drift - shock
+    
+    return log_paths
+
+
+@jit(_LOG_PATH_SIGNATURES, nopython=True, cache=True, fastmath=True)
+def _antithetic_log_paths_ser(log_S0, drift, vol, Z, n_paths):
+    """Serial _antithetic_log_paths_par, compiled under its own cache key"""
+    n_steps, n_half = Z.shape
+    n_mirror = n_paths - n_half
+    log_paths = np.empty((n_steps + 1, n_paths), dtype=Z.dtype)
+    log_paths[0, :] = log_S0
+    
+    for j in range(n_steps):
+        for i in range(n_half):
+            shock = vol * Z[j, i]
+            log_paths[j + 1, i] = log_paths[j, i] + drift + shock
+            if i < n_mirror:
+                log_paths[j + 1, n_half + i] = log_paths[j, n_half + i] + drift - shock
+    
+    return log_paths
+
+
+def _draw_normals(rng, n_steps, n_points, dtype, method):
+    """Time-major (n_steps, n_points) standard normals for the path kernels"""
+    if method == 'pseudo':
+        return rng.standard_normal((n_steps, n_points), dtype=dtype)
+    if method == 'sobol':
+        return _sobol_normals(n_steps, n_points, rng, dtype)
+    raise ValueError(f"Unknown sampling method: {method}")
+
+
+def _brownian_bridge_order(n_steps):
+    """
+    Bisection schedule for building a Brownian path on n_steps unit steps
+    
+    Returns:
+        List of (mid, left, right) grid indices in fill order; the terminal
+        point is filled first and is not included
+    """
+    schedule = []
+    intervals = [(0, n_steps)]
+    for left, right in intervals:
+        if right - left > 1:
+            mid = (left + right) // 2
+            schedule.append((mid, left, right))
+            intervals.append((left, mid))
+            intervals.append((mid, right))
+    return schedule
+
+
+def _sobol_normals(n_steps, n_points, rng, dtype=np.float64):
+    """
+    Scrambled Sobol normals mapped to per-step increments by a Brownian bridge
+    
+    Sobol dimension 0 sets the terminal value and later dimensions fill in
+    midpoints by recursive bisection, so the leading (best-distributed)
+    dimensions carry most of the path variance.
+    
+    Args:
+        n_steps: Number of time steps (Sobol dimension)
+        n_points: Number of points (paths, or antithetic pairs)
+        rng: NumPy Generator used to scramble the sequence
+        dtype: Output dtype
+        
+    Returns:
+        Array of shape (n_steps, n_points) of standard normal increments
+    """
+    # Deferred: scipy.stats costs noticeably more to import than the rest of this module
+    from scipy.stats import qmc
+    from scipy.special import ndtri
+    
+    # A power-of-two prefix keeps the sequence's balance properties
+    m = max(int(np.ceil(np.log2(n_points))), 0)
+    u = qmc.Sobol(d=n_steps, scramble=True, seed=rng).random_base2(m)[:n_points]
+    z = ndtri(u.T)
+    
+    # Brownian motion in units of one step, so increments are N(0, 1)
+    W = np.empty((n_steps + 1, n_points))
+    W[0] = 0.0
+    W[n_steps] = np.sqrt(n_steps) * z[0]
+    for k, (mid, left, right) in enumerate(_brownian_bridge_order(n_steps), start=1):
+        w_left = (right - mid) / (right - left)
+        w_right = (mid - left) / (right - left)
+        std = np.sqrt((mid - left) * (right - mid) / (right - left))
+        W[mid] = w_left * W[left] + w_right * W[right] + std * z[k]
+    
+    return np.diff(W, axis=0).astype(dtype)
+
+
+def monte_carlo_log_paths(S0, sigma, r, T, n_paths, n_steps, seed=None, exp_at_end=False,
+                          dtype=np.float64, method='pseudo'):
+    """
+    Monte Carlo log-price paths with antithetic variates, time-major
+    
+    Normals are drawn in one batch from a NumPy Generator; each draw is used
+    for a path and its mirror, halving the RNG work and reducing variance.
+    Callers that only need terminal values can take np.exp(log_paths[-1]).
+    
+    Args:
+        S0: Initial spot price
+        sigma: Volatility
+        r: Risk-free rate
+        T: Time horizon
+        n_paths: Number of simulation paths
+        n_steps: Number of time steps
+        seed: Optional seed for reproducible paths (default: shared generator)
+        exp_at_end: Exponentiate in place and return prices instead of log prices
+        dtype: Precision of the draws, step arithmetic and stored paths;
+            np.float32 halves memory (see monte_carlo_paths)
+        method: 'pseudo' for NumPy draws, 'sobol' for scrambled Sobol points
+            with a Brownian bridge (lower error for the same path count)
+        
+    Returns:
+        Array of the given dtype and shape (n_steps+1, n_paths)
+    """
+    rng = _rng if seed is None else np.random.default_rng(seed)
+    Z = _draw_normals(rng, n_steps, (n_paths + 1) // 2, dtype, method)
+    
+    dt = T / n_steps
+    ftype = np.dtype(dtype).type
+    kernel = _antithetic_log_paths_par if n_paths >= PARALLEL_THRESHOLD else _antithetic_log_paths_ser
+    log_paths = kernel(
+        ftype(np.log(S0)), ftype((r - 0.5 * sigma**2) * dt), ftype(sigma * np.sqrt(dt)), Z, n_paths
+    )
+    
+    if exp_at_end:
+        np.exp(log_paths, out=log_paths)
+    return log_paths
+
+
+def monte_carlo_paths(S0, sigma, r, T, n_paths, n_steps, seed=None, dtype=np.float64,
+                      method='pseudo'):
     """
-    Vectorized Monte Carlo path generation with parallel execution
+    Monte Carlo price paths in the path-major layout
+    
+    Compatibility wrapper over monte_carlo_log_paths, returning its buffer
+    transposed (a view, no copy). With dtype=np.float32
+    the draws, path arithmetic and result are all single precision: at
+    10,000 paths the ~1% sampling error dwarfs float32 rounding. This is for
+    Monte Carlo only; the Black-Scholes and binomial pricers stay float64 for
+    the accuracy targets in validation.py.
     
     Args:
         S0: Initial spot price
@@ -171,30 +476,187 @@ def monte_carlo_paths(S0, sigma, r, T, n_paths, n_steps):
         T: Time horizon
         n_paths: Number of simulation paths
         n_steps: Number of time steps
+        seed: Optional seed for reproducible paths (default: shared generator)
+        dtype: np.float64 (default) or np.float32
+        method: 'pseudo' or 'sobol' (see monte_carlo_log_paths)
         
     Returns:
         Array of shape (n_paths, n_steps+1) with price paths
     """
+    prices = monte_carlo_log_paths(S0, sigma, r, T, n_paths, n_steps, seed,
+                                   exp_at_end=True, dtype=dtype, method=method)
+    return prices.T
+
+
+@jit([types.float64(types.float64, types.float64, types.float64, types.float64,
+                    types.float64, types.boolean, types.int64, types.int64,
+                    types.Array(ftype, 2, 'C', readonly=True))
+      for ftype in (types.float64, types.float32)],
+     nopython=True, parallel=True, cache=True, fastmath=True)
+def mc_european_price(S0, K, sigma, r, T, is_call, n_paths, n_steps, Z):
+    """
+    Monte Carlo European price with the payoff fused into the path loop
+    
+    Each path walks its log-price in a register and only the payoff sum
+    leaves the loop, so the (n_steps+1, n_paths) path array is never
+    materialized. Each row of Z drives a path and its antithetic mirror.
+    Path arithmetic runs in Z's dtype (float32 Z halves the bytes read);
+    the payoff sum is always accumulated in float64.
+    
+    Args:
+        S0: Initial spot price
+        K: Strike price
+        sigma: Volatility
+        r: Risk-free rate
+        T: Time to maturity
+        is_call: True for call, False for put
+        n_paths: Number of simulation paths
+        n_steps: Number of time steps
+        Z: C-contiguous standard normals of shape (ceil(n_paths / 2), n_steps)
+        
+    Returns:
+        Discounted expected payoff
+    """
+    n_half = Z.shape[0]
+    n_mirror = n_paths - n_half
     dt = T / n_steps
-    paths = np.zeros((n_paths, n_steps + 1))
-    paths[:, 0] = S0
+    drift = Z.dtype.type((r - 0.5 * sigma * sigma) * dt)
+    vol = Z.dtype.type(sigma * np.sqrt(dt))
+    log_S0 = Z.dtype.type(np.log(S0))
     
-    # Parallel loop over paths
-    for i in prange(n_paths):
+    total = 0.0
+    for i in prange(n_half):
+        s_up = log_S0
+        s_down = log_S0
         for j in range(n_steps):
-            z = np.random.randn()
-            paths[i, j + 1] = paths[i, j] * np.exp(
-                (r - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * z
-            )
+            shock = vol * Z[i, j]
+            s_up += drift + shock
+            s_down += drift - shock
+        
+        if is_call:
+            payoff = max(np.exp(s_up) - K, 0.0)
+            if i < n_mirror:
+                payoff += max(np.exp(s_down) - K, 0.0)
+        else:
+            payoff = max(K - np.exp(s_up), 0.0)
+            if i < n_mirror:
+                payoff += max(K - np.exp(s_down), 0.0)
+        total += payoff
+    
+    return np.exp(-r * T) * total / n_paths
+
+
+def monte_carlo_price(S0, K, sigma, r, T, is_call, n_paths, n_steps, seed=None,
+                      dtype=np.float64, method='pseudo'):
+    """
+    Monte Carlo European option price without storing paths
+    
+    Args:
+        S0: Initial spot price
+        K: Strike price
+        sigma: Volatility
+        r: Risk-free rate
+        T: Time to maturity
+        is_call: True for call, False for put
+        n_paths: Number of simulation paths
+        n_steps: Number of time steps
+        seed: Optional seed for a reproducible estimate (default: shared generator)
+        dtype: Precision of the draws and path arithmetic, np.float64 or np.float32
+        method: 'pseudo' or 'sobol' (see monte_carlo_log_paths)
+        
+    Returns:
+        Discounted expected payoff
+    """
+    rng = _rng if seed is None else np.random.default_rng(seed)
+    n_half = (n_paths + 1) // 2
+    if method == 'pseudo':
+        # Path-major so each prange iteration reads one contiguous row
+        Z = rng.standard_normal((n_half, n_steps), dtype=dtype)
+    else:
+        Z = np.ascontiguousarray(_draw_normals(rng, n_steps, n_half, dtype, method).T)
+    return mc_european_price(S0, K, sigma, r, T, is_call, n_paths, n_steps, Z)
+
+
+@jit(types.float64(types.float64, types.float64, types.float64, types.float64,
+                   types.float64, types.boolean),
+     nopython=True, cache=True, fastmath=True, inline='always')
+def _bs_price_hoisted(S, K, vol_sqrt_T, drift, discounted_K, is_call):
+    """black_scholes_price at one spot, with the spot-independent terms precomputed"""
+    d1 = (np.log(S / K) + drift) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
+    if is_call:
+        return S * norm_cdf(d1) - discounted_K * norm_cdf(d2)
+    return discounted_K * norm_cdf(-d2) - S * norm_cdf(-d1)
+
+
+@jit(types.void(_readonly_1d, types.float64, types.float64, types.float64,
+                types.float64, types.boolean, types.float64[:]),
+     nopython=True, cache=True, fastmath=True)
+def _bs_price_array(spot, K, sigma, r, T, is_call, out):
+    """
+    Black-Scholes prices over an array of spots, written into out
+    
+    Invariants of (K, sigma, r, T) are hoisted and the loop is a single flat
+    serial pass so LLVM can vectorize it across spots.
+    
+    Args:
+        spot: Contiguous array of spot prices
+        K: Strike price
+        sigma: Volatility
+        r: Risk-free rate
+        T: Time to maturity
+        is_call: True for call, False for put
+        out: Contiguous output array, same length as spot
+    """
+    sqrt_T = np.sqrt(T)
+    vol_sqrt_T = sigma * sqrt_T
+    drift = (r + 0.5 * sigma * sigma) * T
+    discounted_K = K * np.exp(-r * T)
+    
+    for i in range(spot.shape[0]):
+        out[i] = _bs_price_hoisted(spot[i], K, vol_sqrt_T, drift, discounted_K, is_call)
+
+
+@jit(types.float64[:](_readonly_1d, types.float64, types.float64, types.float64,
+                      types.float64, types.boolean),
+     nopython=True, cache=True, fastmath=True)
+def _vectorized_option_pricing_ser(spot_array, K, sigma, r, T, is_call):
+    """Serial vectorized_option_pricing kernel"""
+    spots = np.ascontiguousarray(spot_array)
+    prices = np.empty(spots.shape[0])
+    _bs_price_array(spots, K, sigma, r, T, is_call, prices)
+    
+    return prices
+
+
+@jit(types.float64[:](_readonly_1d, types.float64, types.float64, types.float64,
+                      types.float64, types.boolean),
+     nopython=True, parallel=True, cache=True, fastmath=True)
+def _vectorized_option_pricing_par(spot_array, K, sigma, r, T, is_call):
+    """Parallel vectorized_option_pricing kernel, spots split across threads"""
+    spots = np.ascontiguousarray(spot_array)
+    n = spots.shape[0]
+    prices = np.empty(n)
+    
+    sqrt_T = np.sqrt(T)
+    vol_sqrt_T = sigma * sqrt_T
+    drift = (r + 0.5 * sigma * sigma) * T
+    discounted_K = K * np.exp(-r * T)
+    
+    for i in prange(n):
+        prices[i] = _bs_price_hoisted(spots[i], K, vol_sqrt_T, drift, discounted_K, is_call)
     
-    return paths
+    return prices
 
 
-@jit(nopython=True, parallel=True, cache=True)
 def vectorized_option_pricing(spot_array, K, sigma, r, T, is_call):
     """
     Vectorized option pricing for multiple spot prices
     
+    Arrays shorter than PARALLEL_THRESHOLD are priced serially, longer ones
+    across threads. The two kernels are separately named functions so their
+    on-disk caches can't be mixed up (Numba's cache key ignores parallel=).
+    
     Args:
         spot_array: Array of spot prices
         K: Strike price
@@ -206,13 +668,93 @@ def vectorized_option_pricing(spot_array, K, sigma, r, T, is_call):
     Returns:
         Array of option prices
     """
-    n = len(spot_array)
-    prices = np.zeros(n)
+    spot_array = np.asarray(spot_array, dtype=np.float64)
+    if spot_array.shape[0] < PARALLEL_THRESHOLD:
+        return _vectorized_option_pricing_ser(spot_array, K, sigma, r, T, is_call)
+    return _vectorized_option_pricing_par(spot_array, K, sigma, r, T, is_call)
+
+
+@jit(types.UniTuple(types.float64, 5)(types.float64, types.float64, types.float64,
+                                      types.float64, types.float64, types.float64,
+                                      types.float64, types.float64, types.float64),
+     nopython=True, cache=True, fastmath=True, inline='always')
+def _greeks_hoisted(S, K, sigma, r, T, sqrt_T, vol_sqrt_T, discounted_K, put_shift):
+    """black_scholes_greeks at one spot, with the spot-independent terms precomputed"""
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_T
+    d2 = d1 - vol_sqrt_T
+    cdf_d1, pdf_d1 = norm_cdf_pdf(d1)
+    n_d2 = norm_cdf(d2) - put_shift
     
-    for i in prange(n):
-        prices[i] = black_scholes_price(spot_array[i], K, sigma, r, T, is_call)
+    delta = cdf_d1 - put_shift
+    gamma = pdf_d1 / (S * vol_sqrt_T)
+    vega = S * pdf_d1 * sqrt_T / 100.0
+    theta = (-(S * pdf_d1 * sigma) / (2.0 * sqrt_T) - r * discounted_K * n_d2) / 365.0
+    rho = T * discounted_K * n_d2 / 100.0
+    return delta, gamma, vega, theta, rho
+
+
+_GREEKS_ARRAY_SIGNATURE = types.void(
+    _readonly_1d, types.float64, types.float64, types.float64, types.float64, types.boolean,
+    types.float64[:], types.float64[:], types.float64[:], types.float64[:], types.float64[:]
+)
+
+
+@jit(_GREEKS_ARRAY_SIGNATURE, nopython=True, parallel=True, cache=True, fastmath=True)
+def _greeks_array_par(spot_array, K, sigma, r, T, is_call,
+                      out_delta, out_gamma, out_vega, out_theta, out_rho):
+    """
+    Black-Scholes Greeks over an array of spots, written into the out arrays
     
-    return prices
+    sqrt(T), sigma*sqrt(T) and K*exp(-rT) are computed once for all spots,
+    and d1/d2 once per spot for all five Greeks. _greeks_array_ser is the
+    same loop without threading.
+    
+    Args:
+        spot_array: Array of spot prices
+        K: Strike price
+        sigma: Volatility
+        r: Risk-free rate
+        T: Time to maturity
+        is_call: True for call, False for put
+        out_delta, out_gamma, out_vega, out_theta, out_rho: Output arrays,
+            same length as spot_array
+    """
+    sqrt_T = np.sqrt(T)
+    vol_sqrt_T = sigma * sqrt_T
+    discounted_K = K * np.exp(-r * T)
+    put_shift = 0.0 if is_call else 1.0
+    
+    for i in prange(spot_array.shape[0]):
+        out_delta[i], out_gamma[i], out_vega[i], out_theta[i], out_rho[i] = _greeks_hoisted(
+            spot_array[i], K, sigma, r, T, sqrt_T, vol_sqrt_T, discounted_K, put_shift
+        )
+
+
+@jit(_GREEKS_ARRAY_SIGNATURE, nopython=True, cache=True, fastmath=True)
+def _greeks_array_ser(spot_array, K, sigma, r, T, is_call,
+                      out_delta, out_gamma, out_vega, out_theta, out_rho):
+    """Serial _greeks_array_par, compiled under its own cache key"""
+    sqrt_T = np.sqrt(T)
+    vol_sqrt_T = sigma * sqrt_T
+    discounted_K = K * np.exp(-r * T)
+    put_shift = 0.0 if is_call else 1.0
+    
+    for i in range(spot_array.shape[0]):
+        out_delta[i], out_gamma[i], out_vega[i], out_theta[i], out_rho[i] = _greeks_hoisted(
+            spot_array[i], K, sigma, r, T, sqrt_T, vol_sqrt_T, discounted_K, put_shift
+        )
+
+
+@lru_cache(maxsize=4096)
+def _cached_bs_price(S, K, sigma, r, T, is_call):
+    """Memoized black_scholes_price"""
+    return black_scholes_price(S, K, sigma, r, T, is_call)
+
+
+@lru_cache(maxsize=4096)
+def _cached_bs_greeks(S, K, sigma, r, T, is_call):
+    """Memoized black_scholes_greeks, as a (delta, gamma, vega, theta, rho) tuple"""
+    return black_scholes_greeks(S, K, sigma, r, T, is_call)
 
 
 class OptimizedPricingEngine:
@@ -223,12 +765,18 @@ class OptimizedPricingEngine:
     def __init__(self, binomial_steps: int = 100):
         self.binomial_steps = binomial_steps
     
+    @staticmethod
+    def cache_clear():
+        """Drop memoized Black-Scholes prices and Greeks (e.g. before timing)"""
+        _cached_bs_price.cache_clear()
+        _cached_bs_greeks.cache_clear()
+    
     def price(self, params: OptionParams) -> float:
         """Price an option using optimized methods"""
         is_call = params.option_type == 'call'
         
         if params.style == 'european':
-            return black_scholes_price(
+            return _cached_bs_price(
                 params.spot, params.strike, params.volatility,
                 params.rate, params.maturity, is_call
             )
@@ -239,80 +787,48 @@ class OptimizedPricingEngine:
                 is_call, True
             )
     
-    def greeks(self, params: OptionParams) -> Dict[str, float]:
+    def greeks(self, params: OptionParams) -> Greeks:
         """Calculate Greeks using optimized methods"""
         if params.style == 'european':
             is_call = params.option_type == 'call'
-            delta, gamma, vega, theta, rho = black_scholes_greeks(
+            return Greeks(*_cached_bs_greeks(
                 params.spot, params.strike, params.volatility,
                 params.rate, params.maturity, is_call
-            )
-            
-            return {
-                'delta': delta,
-                'gamma': gamma,
-                'vega': vega,
-                'theta': theta,
-                'rho': rho
-            }
+            ))
         else:
             # Numerical Greeks for American options
             return self._numerical_greeks(params)
     
-    def _numerical_greeks(self, params: OptionParams) -> Dict[str, float]:
+    def _numerical_greeks(self, params: OptionParams) -> Greeks:
         """Numerical Greeks calculation"""
-        base_price = self.price(params)
+        h = 0.01 * params.spot
+        h_vol = 0.01
+        h_time = 1 / 365
+        h_rate = 0.01
+        
+        base_price, price_up, price_down, price_vol_up, price_time, price_rate_up = \
+            _numerical_greeks_batched(
+                params.spot, params.strike, params.volatility, params.rate,
+                params.maturity, self.binomial_steps, params.option_type == 'call',
+                h, h_vol, h_time, h_rate
+            )
         
         # Delta
-        h = 0.01 * params.spot
-        is_call = params.option_type == 'call'
-        price_up = binomial_tree_price(
-            params.spot + h, params.strike, params.volatility,
-            params.rate, params.maturity, self.binomial_steps, is_call, True
-        )
-        price_down = binomial_tree_price(
-            params.spot - h, params.strike, params.volatility,
-            params.rate, params.maturity, self.binomial_steps, is_call, True
-        )
         delta = (price_up - price_down) / (2 * h)
         
         # Gamma
         gamma = (price_up - 2 * base_price + price_down) / (h ** 2)
         
         # Vega
-        h_vol = 0.01
-        price_vol_up = binomial_tree_price(
-            params.spot, params.strike, params.volatility + h_vol,
-            params.rate, params.maturity, self.binomial_steps, is_call, True
-        )
         vega = (price_vol_up - base_price) / 1.0
         
         # Theta
-        h_time = 1 / 365
-        if params.maturity > h_time:
-            price_time = binomial_tree_price(
-                params.spot, params.strike, params.volatility,
-                params.rate, params.maturity - h_time, self.binomial_steps, is_call, True
-            )
-            theta = price_time - base_price
-        else:
-            theta = 0.0
+        theta = price_time - base_price if params.maturity > h_time else 0.0
         
         # Rho
-        h_rate = 0.01
-        price_rate_up = binomial_tree_price(
-            params.spot, params.strike, params.volatility,
-            params.rate + h_rate, params.maturity, self.binomial_steps, is_call, True
-        )
         rho = (price_rate_up - base_price) / 1.0
         
-        return {
-            'delta': delta,
-            'gamma': gamma,
-            'vega': vega,
-            'theta': theta,
-            'rho': rho
-        }
+        return Greeks(delta, gamma, vega, theta, rho)
     
     def price_multiple(self, spot_array: np.ndarray, params: OptionParams) -> np.ndarray:
         """
@@ -331,6 +847,55 @@ class OptimizedPricingEngine:
             params.rate, params.maturity, is_call
         )
     
+    def mc_price(
+        self,
+        params: OptionParams,
+        n_paths: int = 100000,
+        n_steps: int = 252,
+        seed: int = None,
+        dtype=np.float64,
+        method: Literal['pseudo', 'sobol'] = 'pseudo'
+    ) -> float:
+        """
+        Price a European option by Monte Carlo, fusing payoff into simulation
+        
+        Args:
+            params: Option parameters (style is ignored; exercise is at maturity)
+            n_paths: Number of paths
+            n_steps: Number of time steps
+            seed: Optional seed for a reproducible estimate
+            dtype: np.float32 for single-precision paths (payoff sum stays float64)
+            method: 'sobol' for quasi-random draws with a Brownian bridge
+            
+        Returns:
+            Option price
+        """
+        is_call = params.option_type == 'call'
+        return monte_carlo_price(
+            params.spot, params.strike, params.volatility,
+            params.rate, params.maturity, is_call, n_paths, n_steps, seed, dtype, method
+        )
+    
+    def greeks_multiple(self, spot_array: np.ndarray, params: OptionParams) -> Dict[str, np.ndarray]:
+        """
+        Calculate Black-Scholes Greeks for multiple spot prices in one pass
+        
+        Args:
+            spot_array: Array of spot prices
+            params: Option parameters (spot will be overridden; priced as European)
+            
+        Returns:
+            Dictionary of Greek name to array, each the length of spot_array
+        """
+        spots = np.asarray(spot_array, dtype=np.float64)
+        out = {name: np.empty(spots.shape[0]) for name in Greeks._fields}
+        kernel = _greeks_array_ser if spots.shape[0] < PARALLEL_THRESHOLD else _greeks_array_par
+        kernel(
+            spots, params.strike, params.volatility, params.rate, params.maturity,
+            params.option_type == 'call', *out.values()
+        )
+        return out
+    
     def simulate_paths(
         self, 
         S0: float, 
@@ -338,8 +903,13 @@ class OptimizedPricingEngine:
         r: float, 
         T: float, 
         n_paths: int = 10000, 
-        n_steps: int = 252
-    ) -> np.ndarray:
+        n_steps: int = 252,
+        seed: int = None,
+        backend: Literal['auto', 'cpu', 'cuda'] = 'auto',
+        to_host: bool = True,
+        dtype=np.float64,
+        method: Literal['pseudo', 'sobol'] = 'pseudo'
+    ):
         """
         Generate Monte Carlo price paths (optimized)
         
@@ -350,8 +920,87 @@ class OptimizedPricingEngine:
             T: Time horizon
             n_paths: Number of paths
             n_steps: Number of time steps
+            seed: Optional seed for reproducible paths (CPU and GPU streams differ)
+            backend: 'cpu', 'cuda', or 'auto' to use CUDA when a device is
+                present and n_paths * n_steps > GPU_THRESHOLD
+            to_host: With the CUDA backend, False returns the device array
+                (float32, time-major (n_steps+1, n_paths)) without copying
+            dtype: np.float64 (default) or np.float32 paths; the CUDA kernel
+                always simulates in float32
+            method: 'pseudo', or 'sobol' for scrambled Sobol draws with a
+                Brownian bridge (CPU only; 'auto' then stays on the CPU)
             
         Returns:
             Array of shape (n_paths, n_steps+1)
         """
-        return monte_carlo_paths(S0, sigma, r, T, n_paths, n_steps)
+        if self._use_gpu(backend, n_paths, n_steps, method):
+            from pricing_gpu import monte_carlo_log_paths_gpu
+            paths = monte_carlo_log_paths_gpu(
+                S0, sigma, r, T, n_paths, n_steps, seed, exp_at_end=True, to_host=to_host
+            )
+            return paths.T.astype(dtype) if to_host else paths
+        return monte_carlo_paths(S0, sigma, r, T, n_paths, n_steps, seed, dtype, method)
+    
+    def simulate_log_paths(
+        self,
+        S0: float,
+        sigma: float,
+        r: float,
+        T: float,
+        n_paths: int = 10000,
+        n_steps: int = 252,
+        seed: int = None,
+        backend: Literal['auto', 'cpu', 'cuda'] = 'auto',
+        to_host: bool = True,
+        dtype=np.float64,
+        method: Literal['pseudo', 'sobol'] = 'pseudo'
+    ):
+        """
+        Generate Monte Carlo log-price paths in the time-major layout (one row per step)
+        
+        Args:
+            S0: Initial spot price
+            sigma: Volatility
+            r: Risk-free rate
+            T: Time horizon
+            n_paths: Number of paths
+            n_steps: Number of time steps
+            seed: Optional seed for reproducible paths
+            backend: 'cpu', 'cuda', or 'auto' (see simulate_paths)
+            to_host: With the CUDA backend, False keeps the result on the device
+            dtype: np.float64 (default) or np.float32 storage and arithmetic;
+                the CUDA kernel always returns float32
+            method: 'pseudo' or 'sobol' (see simulate_paths)
+            
+        Returns:
+            Array of shape (n_steps+1, n_paths)
+        """
+        if self._use_gpu(backend, n_paths, n_steps, method):
+            from pricing_gpu import monte_carlo_log_paths_gpu
+            return monte_carlo_log_paths_gpu(
+                S0, sigma, r, T, n_paths, n_steps, seed, to_host=to_host
+            )
+        return monte_carlo_log_paths(S0, sigma, r, T, n_paths, n_steps, seed,
+                                     dtype=dtype, method=method)
+    
+    @staticmethod
+    def _use_gpu(backend: str, n_paths: int, n_steps: int, method: str = 'pseudo') -> bool:
+        """
+        Resolve a simulate_* backend argument to CUDA (True) or CPU (False)
+        
+        pricing_gpu is imported only here, since loading numba.cuda adds most
+        of a second to import time.
+        """
+        if backend not in ('auto', 'cpu', 'cuda'):
+            raise ValueError(f"Unknown backend: {backend}")
+        if backend == 'cuda':
+            if method != 'pseudo':
+                raise ValueError("The CUDA backend only supports method='pseudo'")
+            return True
+        if backend == 'cpu' or method != 'pseudo':
+            return False
+        if n_paths * n_steps <= GPU_THRESHOLD:
+            return False
+        from pricing_gpu import is_available
+        return is_available()
+
@@ -70,7 +70,8 @@ def main():
     results = simulator.compare_strategies(
         portfolio=portfolio,
         n_scenarios=1000,
-        hedge_option_params=hedge_option
+        hedge_option_params=hedge_option,
+        verbose=True
     )
     
     # Additional analysis